@@ -5,7 +5,6 @@
 # Standard library
 import json
 import shutil
-import uuid
 import struct
 import random
 import asyncio
@@ -24,6 +23,7 @@ import ctypes
 from ctypes import wintypes
 import time
 import subprocess
+import tempfile
 import logging
 from logging.handlers import RotatingFileHandler
 from dataclasses import dataclass
@@ -42,7 +42,7 @@ from PySide6.QtWidgets import (
 import shiboken6
 
 # Internal
-from fingerprint import generate_fingerprint, build_profile_extension, append_load_extension_arg
+from fingerprint import generate_fingerprint, generate_fingerprints, build_profile_extension, append_load_extension_arg
 import profile_ui
 
 # =============================================================================
@@ -362,9 +362,16 @@ def load_json(path: Path, default: Any) -> Any:
 
 def save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    os.replace(tmp, path)
+    # Unique temp file per write so concurrent writers never replace each other's temp
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, ensure_ascii=False, indent=2))
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
 
 def now_iso() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%S")
@@ -456,7 +463,11 @@ def close_profile_loggers_for_folder(profile_folder: str) -> None:
         if (needle_win in logfile) or (needle_posix in logfile):
             _close_logger_key(key)
 
-@dataclass
+# Row statuses are interned so the hot `status == "running"` checks hit the identity fast path.
+_STATUS_RUNNING = sys.intern("running")
+_STATUS_STOPPED = sys.intern("stopped")
+
+@dataclass(slots=True)
 class ProfileRow:
     id: str
     folder: str
@@ -464,6 +475,7 @@ class ProfileRow:
     os: str
     status: str
     proxy_display: str = ""
+    runtime_pid: int | None = None
 
 # =============================================================================
 # WINDOWS: WIN32 HELPERS
@@ -1395,6 +1407,43 @@ else:
 # PROFILE MANAGER
 # =============================================================================
 
+class IndexSnapshot:
+    """
+    Short-lived parsed copy of index.json, open for the duration of a bulk run.
+    While open, index reads share one parse and index writes refresh it.
+    Entries are copied in and out, so a caller's edits only land through _write_index().
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._profiles: List[Dict[str, Any]] | None = None
+
+    def begin(self):
+        with self._lock:
+            self._depth += 1
+
+    def end(self):
+        with self._lock:
+            self._depth = max(0, self._depth - 1)
+            if self._depth == 0:
+                self._profiles = None
+
+    def get(self, loader) -> List[Dict[str, Any]] | None:
+        with self._lock:
+            if self._depth == 0:
+                return None
+            if self._profiles is None:
+                self._set(loader())
+            return [dict(p) for p in self._profiles]
+
+    def put(self, profiles: List[Dict[str, Any]]):
+        with self._lock:
+            if self._depth > 0:
+                self._set(profiles)
+
+    def _set(self, profiles: List[Dict[str, Any]]):
+        self._profiles = [dict(p) for p in profiles]
+
 class ProfileManager:
     def __init__(self, storage: Storage):
         self.s = storage
@@ -1402,41 +1451,61 @@ class ProfileManager:
         self._procs = {}
         self.on_profile_exit = None
         self.bridge = ProxyBridgeManager()
+        self._index_snapshot = IndexSnapshot()
+        # Held across every index.json read-modify-write (UI, bulk workers, exit watchers)
+        self._index_lock = threading.RLock()
 
-    def _read_index_profiles(self) -> List[Dict[str, Any]]:
+    def _load_index_profiles(self) -> List[Dict[str, Any]]:
         idx = load_json(self.s.index_path(), {"profiles": []})
         return idx.get("profiles", [])
 
+    def _read_index_profiles(self) -> List[Dict[str, Any]]:
+        cached = self._index_snapshot.get(self._load_index_profiles)
+        if cached is not None:
+            return cached
+        return self._load_index_profiles()
+
     def _write_index(self, profiles: List[Dict[str, Any]]):
-        save_json(self.s.index_path(), {"profiles": profiles})
+        with self._index_lock:
+            save_json(self.s.index_path(), {"profiles": profiles})
+            self._index_snapshot.put(profiles)
+
+    def _set_index_status(self, profile_id: str, status: str) -> None:
+        with self._index_lock:
+            ps = self._read_index_profiles()
+            for p in ps:
+                if p.get("id") == profile_id:
+                    p["status"] = status
+            self._write_index(ps)
 
     def reconcile_index(self) -> int:
         """Remove index entries whose folder/profile.json no longer exist on disk."""
-        profiles = self._read_index_profiles()
-        kept: List[Dict[str, Any]] = []
-        removed = 0
-
-        for p in profiles:
-            folder = str(p.get("folder") or "").strip()
-            if not folder:
-                removed += 1
-                continue
+        with self._index_lock:
+            profiles = self._read_index_profiles()
+            kept: List[Dict[str, Any]] = []
+            removed = 0
+
+            for p in profiles:
+                folder = str(p.get("folder") or "").strip()
+                if not folder:
+                    removed += 1
+                    continue
 
-            pdir = self.s.profile_root / folder
-            if not pdir.exists():
-                removed += 1
-                continue
+                pdir = self.s.profile_root / folder
+                if not pdir.exists():
+                    removed += 1
+                    continue
 
-            if not (pdir / "profile.json").exists():
-                removed += 1
-                continue
+                if not (pdir / "profile.json").exists():
+                    removed += 1
+                    continue
 
-            kept.append(p)
+                kept.append(p)
 
-        if removed:
-            self._write_index(kept)
+            if removed:
+                self._write_index(kept)
 
-        return removed
+            return removed
 
     def _next_id(self) -> str:
         used = {p["id"] for p in self._read_index_profiles() if "id" in p}
@@ -1455,6 +1524,9 @@ class ProfileManager:
             pass
 
         rows: List[ProfileRow] = []
+        # returncode is refreshed by the exit watcher's poll() loop; _procs is snapshotted
+        # because start/stop threads add and remove entries while this runs
+        live_pids = {pid_: pr.pid for pid_, pr in list(self._procs.items()) if pr.returncode is None}
 
         for p in self._read_index_profiles():
             folder = p.get("folder", "")
@@ -1470,38 +1542,119 @@ class ProfileManager:
                 folder=folder,
                 name=p.get("name", ""),
                 os=p.get("os", "windows"),
-                status=p.get("status", "stopped"),
+                status=sys.intern(str(p.get("status", _STATUS_STOPPED))),
                 proxy_display=proxy_text,
+                runtime_pid=live_pids.get(p.get("id", "")),
             ))
 
         return rows
 
-    def create_profile(self, name: str, os_name: str) -> ProfileRow:
-        pid = self._next_id()
-        safe = "".join([c for c in name if c.isalnum() or c in ("_", "-", " ")])[:40].strip() or "profile"
-        folder = f"{pid}_{safe}".replace(" ", "_")
-        pdir = self.s.profile_root / folder
-        pdir.mkdir(parents=True, exist_ok=True)
-
-        fp_data = generate_fingerprint(os_name)
-
-        save_json(pdir / "profile.json", {
-            "id": pid,
-            "name": name,
-            "os": os_name,
-            "createdAt": now_iso(),
-            "updatedAt": now_iso(),
-            "runtime": {"status": "stopped", "pid": None, "lastError": None},
-            "paths": {"browserDataDir": ".\\chrome_data"},
-            "fingerprint": fp_data,
-            "webrtc": {"mode": "altered"}
-        })
-        (pdir / "chrome_data").mkdir(exist_ok=True)
+    def refresh_row(self, row: ProfileRow) -> ProfileRow | None:
+        """Current index status and live pid for a previously listed row; None if it left the index."""
+        for p in self._read_index_profiles():
+            if p.get("id") != row.id:
+                continue
+            proc = self._procs.get(row.id)
+            return ProfileRow(
+                id=row.id,
+                folder=p.get("folder") or row.folder,
+                name=p.get("name", row.name),
+                os=p.get("os", row.os),
+                status=sys.intern(str(p.get("status", _STATUS_STOPPED))),
+                proxy_display=row.proxy_display,
+                runtime_pid=proc.pid if proc is not None and proc.returncode is None else None,
+            )
+        return None
 
-        ps = self._read_index_profiles()
-        ps.append({"id": pid, "folder": folder, "name": name, "os": os_name, "status": "stopped", "proxyDisplay": ""})
-        self._write_index(ps)
-        return ProfileRow(id=pid, folder=folder, name=name, os=os_name, status="stopped", proxy_display="")
+    def create_profile(self, name: str, os_name: str, fingerprint: dict | None = None) -> ProfileRow:
+        with self._index_lock:
+            pid = self._next_id()
+            safe = "".join([c for c in name if c.isalnum() or c in ("_", "-", " ")])[:40].strip() or "profile"
+            folder = f"{pid}_{safe}".replace(" ", "_")
+            pdir = self.s.profile_root / folder
+            pdir.mkdir(parents=True, exist_ok=True)
+
+            fp_data = fingerprint or generate_fingerprint(os_name)
+
+            save_json(pdir / "profile.json", {
+                "id": pid,
+                "name": name,
+                "os": os_name,
+                "createdAt": now_iso(),
+                "updatedAt": now_iso(),
+                "runtime": {"status": "stopped", "pid": None, "lastError": None},
+                "paths": {"browserDataDir": ".\\chrome_data"},
+                "fingerprint": fp_data,
+                "webrtc": {"mode": "altered"}
+            })
+            (pdir / "chrome_data").mkdir(exist_ok=True)
+
+            ps = self._read_index_profiles()
+            ps.append({"id": pid, "folder": folder, "name": name, "os": os_name, "status": "stopped", "proxyDisplay": ""})
+            self._write_index(ps)
+            return ProfileRow(id=pid, folder=folder, name=name, os=os_name, status="stopped", proxy_display="")
+
+    def create_profiles_bulk(self, specs: List[Dict[str, Any]]) -> List[ProfileRow]:
+        """
+        Create many profiles with a single index.json rewrite.
+        Each spec: {"name", "os", "notes", "proxy", "webrtc"} plus an optional pre-generated
+        "fingerprint"; profile.json is written once per profile with the final metadata
+        (same result as create_profile + update_profile).
+        """
+        with self._index_lock:
+            ps = self._read_index_profiles()
+            used = {p["id"] for p in ps if "id" in p}
+
+            per_os: Dict[str, int] = {}
+            for spec in specs:
+                if spec.get("fingerprint"):
+                    continue
+                os_name = spec.get("os") or "windows"
+                per_os[os_name] = per_os.get(os_name, 0) + 1
+            fps = {os_name: generate_fingerprints(cnt, os_name) for os_name, cnt in per_os.items()}
+
+            rows: List[ProfileRow] = []
+            n = 1
+            for spec in specs:
+                name = spec.get("name") or ""
+                os_name = spec.get("os") or "windows"
+                proxy = spec.get("proxy")
+                webrtc = spec.get("webrtc")
+
+                while f"p_{n:04d}" in used:
+                    n += 1
+                pid = f"p_{n:04d}"
+                used.add(pid)
+
+                safe = "".join([c for c in name if c.isalnum() or c in ("_", "-", " ")])[:40].strip() or "profile"
+                folder = f"{pid}_{safe}".replace(" ", "_")
+                pdir = self.s.profile_root / folder
+                pdir.mkdir(parents=True, exist_ok=True)
+
+                prof = {
+                    "id": pid,
+                    "name": name,
+                    "os": os_name,
+                    "createdAt": now_iso(),
+                    "updatedAt": now_iso(),
+                    "runtime": {"status": "stopped", "pid": None, "lastError": None},
+                    "paths": {"browserDataDir": ".\\chrome_data"},
+                    "fingerprint": spec.get("fingerprint") or fps[os_name].pop(),
+                    "webrtc": webrtc if webrtc is not None else {"mode": "altered"},
+                    "notes": spec.get("notes") or "",
+                }
+                if proxy is not None:
+                    prof["proxy"] = proxy
+                save_json(pdir / "profile.json", prof)
+                (pdir / "chrome_data").mkdir(exist_ok=True)
+
+                display = _proxy_display(proxy) if proxy is not None else ""
+                ps.append({"id": pid, "folder": folder, "name": name, "os": os_name, "status": "stopped", "proxyDisplay": display})
+                rows.append(ProfileRow(id=pid, folder=folder, name=name, os=os_name, status="stopped", proxy_display=display))
+
+            if rows:
+                self._write_index(ps)
+            return rows
 
     def update_profile(self, row: ProfileRow, name: str, os_name: str, notes: str = "", proxy: dict | None = None, webrtc: dict | None = None) -> None:
         """Update profile metadata. If profile name changes, also rename the profile folder on disk (stopped-only)."""
@@ -1567,16 +1720,17 @@ class ProfileManager:
 
         save_json(prof_path, prof)
 
-        profiles = self._read_index_profiles()
-        for p in profiles:
-            if p.get("id") == row.id:
-                p["name"] = name
-                p["os"] = os_name
-                p["folder"] = row.folder
-                if proxy is not None:
-                    p["proxyDisplay"] = _proxy_display(proxy)
-                break
-        self._write_index(profiles)
+        with self._index_lock:
+            profiles = self._read_index_profiles()
+            for p in profiles:
+                if p.get("id") == row.id:
+                    p["name"] = name
+                    p["os"] = os_name
+                    p["folder"] = row.folder
+                    if proxy is not None:
+                        p["proxyDisplay"] = _proxy_display(proxy)
+                    break
+            self._write_index(profiles)
 
     def delete_profile(self, row: ProfileRow) -> None:
         if not row:
@@ -1585,6 +1739,38 @@ class ProfileManager:
         if getattr(row, "status", "") == "running":
             raise RuntimeError("Stop the profile before deleting.")
 
+        self._remove_profile_dir(row)
+
+        with self._index_lock:
+            ps = [p for p in self._read_index_profiles() if p.get("id") != row.id]
+            self._write_index(ps)
+
+    def delete_profiles(self, rows: List[ProfileRow]) -> tuple[List[str], List[str]]:
+        """
+        Delete several profiles with a single index.json rewrite.
+        Returns (deleted ids, error messages); running profiles are skipped.
+        """
+        deleted: List[str] = []
+        errors: List[str] = []
+
+        for row in rows:
+            if not row or getattr(row, "status", "") == "running":
+                continue
+            try:
+                self._remove_profile_dir(row)
+                deleted.append(row.id)
+            except Exception as e:
+                errors.append(f"{row.id}: {e}")
+
+        if deleted:
+            gone = set(deleted)
+            with self._index_lock:
+                ps = [p for p in self._read_index_profiles() if p.get("id") not in gone]
+                self._write_index(ps)
+
+        return deleted, errors
+
+    def _remove_profile_dir(self, row: ProfileRow) -> None:
         close_profile_loggers_for_folder(str(row.folder))
 
         pdir = self.s.profile_root / row.folder
@@ -1604,9 +1790,6 @@ class ProfileManager:
 
             raise RuntimeError(f"Cannot delete the profile folder (file is in use): {last_err}")
 
-        ps = [p for p in self._read_index_profiles() if p.get("id") != row.id]
-        self._write_index(ps)
-
     def _get_browser_path(self) -> Path:
         cfg = load_json(CONFIG_PATH, {})
         rel_or_abs = cfg.get("browser", {}).get("binaryPath", ".\\chromium\\chrome.exe")
@@ -1826,12 +2009,10 @@ class ProfileManager:
             prof["updatedAt"] = now_iso()
             save_json(prof_path, prof)
 
-            ps = self._read_index_profiles()
-            for p in ps:
-                if p["id"] == row.id: p["status"] = "running"
-            self._write_index(ps)
+            self._set_index_status(row.id, "running")
 
             self._procs[row.id] = proc
+            row.runtime_pid = pid
 
             def _watch_exit_full(profile_id: int, folder: str, p: subprocess.Popen):
                 pid = int(getattr(p, "pid", 0) or 0)
@@ -1847,10 +2028,7 @@ class ProfileManager:
                         prof2["runtime"]["pid"] = None
                         prof2["runtime"]["bridge"] = {"enabled": False}
                         save_json(pdir2 / "profile.json", prof2)
-                        ps2 = self._read_index_profiles()
-                        for it in ps2:
-                             if it.get("id") == profile_id: it["status"] = "stopped"
-                        self._write_index(ps2)
+                        self._set_index_status(profile_id, "stopped")
                 except: pass
                 try:
                     if self.on_profile_exit: self.on_profile_exit(profile_id)
@@ -1921,11 +2099,7 @@ class ProfileManager:
             prof["updatedAt"] = now_iso()
             save_json(prof_path, prof)
 
-            ps = self._read_index_profiles()
-            for p in ps:
-                if p["id"] == row.id:
-                    p["status"] = "stopped"
-            self._write_index(ps)
+            self._set_index_status(row.id, "stopped")
 
             plog_info(plog, row.id, row.folder, run_id, "PROFILE STOPPED")
 
@@ -1986,9 +2160,9 @@ class ProfileManager:
                 runtime["bridge"] = {"enabled": False}
                 runtime_changed = True
 
-            if str(p.get("status")) == "running":
-                runtime["status"] = "stopped"
-                p["status"] = "stopped"
+            if str(p.get("status")) == _STATUS_RUNNING:
+                runtime["status"] = _STATUS_STOPPED
+                p["status"] = _STATUS_STOPPED
                 changed_index = True
                 try:
                     changed_ids.add(str(p.get("id")))
@@ -2007,7 +2181,13 @@ class ProfileManager:
                 save_json(prof_path, prof)
 
         if changed_index:
-            self._write_index(ps)
+            # Re-read under the lock so entries written during the scan are kept
+            with self._index_lock:
+                ps = self._read_index_profiles()
+                for p in ps:
+                    if str(p.get("id")) in changed_ids:
+                        p["status"] = _STATUS_STOPPED
+                self._write_index(ps)
 
         return changed_ids
 
@@ -2586,10 +2766,33 @@ class CheckBoxHeader(QtWidgets.QHeaderView):
 # UI: BULK OPERATIONS
 # =============================================================================
 
+class _BulkJobSignals(QtCore.QObject):
+    done = Signal(object, object, str)
+
+
+class _BulkJob(QtCore.QRunnable):
+    """Run one pooled bulk item off the UI thread and report back via a queued signal."""
+    def __init__(self, row, work, signals: _BulkJobSignals):
+        super().__init__()
+        self._row = row
+        self._work = work
+        self.signals = signals
+
+    def run(self):
+        try:
+            result, err = self._work(self._row), ""
+        except Exception as e:
+            result, err = None, str(e) or e.__class__.__name__
+        self.signals.done.emit(self._row, result, err)
+
+
 class BulkRunner(QtCore.QObject):
     """
     Run bulk operations on UI thread in small chunks to keep UI responsive.
     Avoids thread-safety issues with ProfileManager internals.
+
+    start_pooled() is for per-row work that only touches that row's own files:
+    the work runs on a bounded QThreadPool and results are merged on the UI thread.
     """
     progress = Signal(int, int, str)
     finished = Signal(dict)
@@ -2600,21 +2803,36 @@ class BulkRunner(QtCore.QObject):
         self._total = 0
         self._done = 0
         self._running = False
+        self._batched = False
         self._per_tick = 1
         self._fn = None
         self._summary = {}
+        self._on_finished = None
+        self._merge = None
+        self._pool = None
+        self._job_signals = None
 
-    def start(self, rows, per_tick: int, fn, summary: dict):
+    def start(self, rows, per_tick: int, fn, summary: dict, on_finished=None, batched: bool = False):
+        """
+        on_finished(summary) runs right before the finished signal, so completion
+        hooks registered by the caller always see the queue fully drained.
+        batched: each queued item is a list handled by one fn call; progress still
+        counts the rows inside it.
+        Returns False (and does nothing) while another run is active.
+        """
         if self._running:
-            return
+            return False
         self._queue = list(rows)
-        self._total = len(self._queue)
+        self._batched = batched
+        self._total = sum(len(b) for b in self._queue) if batched else len(self._queue)
         self._done = 0
         self._per_tick = max(1, int(per_tick or 1))
         self._fn = fn
         self._summary = summary or {}
+        self._on_finished = on_finished
         self._running = True
         QtCore.QTimer.singleShot(0, self._tick)
+        return True
 
     def _tick(self):
         if not self._running:
@@ -2628,15 +2846,69 @@ class BulkRunner(QtCore.QObject):
             except Exception as e:
                 msg = f"Error: {e}"
                 self._summary.setdefault("errors", []).append((getattr(row, "id", None), str(e)))
-            self._done += 1
+            self._done += len(row) if self._batched else 1
             n += 1
             self.progress.emit(self._done, self._total, msg)
 
         if self._queue:
             QtCore.QTimer.singleShot(0, self._tick)
         else:
-            self._running = False
-            self.finished.emit(self._summary)
+            self._finish()
+
+    def start_pooled(self, rows, work, merge, summary: dict, on_finished=None):
+        """
+        work(row) runs on a worker thread and returns a progress message.
+        merge(row, result, error, summary) runs on the UI thread for each row.
+        Returns False (and does nothing) while another run is active.
+        """
+        if self._running:
+            return False
+        rows = list(rows)
+        self._total = len(rows)
+        self._done = 0
+        self._merge = merge
+        self._summary = summary or {}
+        self._on_finished = on_finished
+        self._running = True
+
+        if not rows:
+            QtCore.QTimer.singleShot(0, self._finish)
+            return True
+
+        if self._pool is None:
+            self._pool = QtCore.QThreadPool(self)
+            self._pool.setMaxThreadCount(max(1, os.cpu_count() or 1))
+        if self._job_signals is None:
+            self._job_signals = _BulkJobSignals(self)
+            self._job_signals.done.connect(self._on_job_done)
+
+        for row in rows:
+            self._pool.start(_BulkJob(row, work, self._job_signals))
+        return True
+
+    def _on_job_done(self, row, result, err: str):
+        if not self._running:
+            return
+        try:
+            self._merge(row, result, err, self._summary)
+        except Exception as e:
+            self._summary.setdefault("errors", []).append((getattr(row, "id", None), str(e)))
+        self._done += 1
+        msg = f"Error: {err}" if err else str(result or "")
+        self.progress.emit(self._done, self._total, msg)
+        if self._done >= self._total:
+            self._finish()
+
+    def _finish(self):
+        self._running = False
+        self._merge = None
+        cb, self._on_finished = self._on_finished, None
+        if cb is not None:
+            try:
+                cb(self._summary)
+            except Exception as e:
+                self._summary.setdefault("errors", []).append((None, str(e)))
+        self.finished.emit(self._summary)
 
 # =============================================================================
 # UI: MAIN WINDOW
@@ -2645,6 +2917,11 @@ class BulkRunner(QtCore.QObject):
 class MainWindow(QMainWindow):
     sig_profile_exited = Signal(object)
 
+    REFRESH_ACTIVE_MS = 2000
+    REFRESH_IDLE_MS = 10000
+    CREATE_BATCH = 10
+    DELETE_BATCH = 3
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Offline Browser Profile")
@@ -2673,6 +2950,12 @@ class MainWindow(QMainWindow):
         layout.addLayout(top)
 
         self.selected_ids: set[str] = set()
+        self._last_selection_active = None
+        self._last_viewport_w = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.apply_column_widths)
         self._reloading_table = False
         self._table_rows: List[ProfileRow] = []
         self._row_index_by_id = {}
@@ -2749,7 +3032,8 @@ class MainWindow(QMainWindow):
 
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.on_timer_refresh)
-        self.timer.start(2000)
+        self.timer.start(self.REFRESH_ACTIVE_MS)
+        self._adapt_refresh_interval()
 
         self._init_tray()
         self.sig_profile_exited.connect(self._on_profile_exited)
@@ -2813,10 +3097,15 @@ class MainWindow(QMainWindow):
         btn_del.setFocusPolicy(Qt.NoFocus)
         btn_del.setAutoDefault(False)
 
-        btn_start.clicked.connect(lambda _=None, rrid=rid: self._on_action_start(rrid))
-        btn_stop.clicked.connect(lambda _=None, rrid=rid: self._on_action_stop(rrid))
-        btn_edit.clicked.connect(lambda _=None, rrid=rid: self._on_action_edit(rrid))
-        btn_del.clicked.connect(lambda _=None, rrid=rid: self._on_action_delete(rrid))
+        btn_start.setProperty("rid", rid)
+        btn_stop.setProperty("rid", rid)
+        btn_edit.setProperty("rid", rid)
+        btn_del.setProperty("rid", rid)
+
+        btn_start.clicked.connect(self._on_action_start_slot)
+        btn_stop.clicked.connect(self._on_action_stop_slot)
+        btn_edit.clicked.connect(self._on_action_edit_slot)
+        btn_del.clicked.connect(self._on_action_delete_slot)
 
         h.addWidget(btn_start)
         h.addWidget(btn_stop)
@@ -2865,6 +3154,34 @@ class MainWindow(QMainWindow):
         if row:
             self.on_delete(row)
 
+    def _sender_rid(self) -> str:
+        """Read the profile id stored on the action button that emitted the signal."""
+        btn = self.sender()
+        if btn is None:
+            return ""
+        return str(btn.property("rid") or "")
+
+    def _on_action_start_slot(self):
+        self._on_action_start(self._sender_rid())
+
+    def _on_action_stop_slot(self):
+        self._on_action_stop(self._sender_rid())
+
+    def _on_action_edit_slot(self):
+        self._on_action_edit(self._sender_rid())
+
+    def _on_action_delete_slot(self):
+        self._on_action_delete(self._sender_rid())
+
+    def _ensure_cell_item(self, row_idx: int, col: int) -> QTableWidgetItem:
+        """Return the text item at (row_idx, col), creating it only if the cell is empty."""
+        it = self.table.item(row_idx, col)
+        if it is None:
+            it = QTableWidgetItem("")
+            it.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
+            self.table.setItem(row_idx, col, it)
+        return it
+
     def _refresh_rows_by_ids(self, ids) -> None:
         """LV2 incremental refresh: update only changed rows; fallback to full reload when needed."""
         try:
@@ -2888,25 +3205,10 @@ class MainWindow(QMainWindow):
                     self.reload_table()
                     return
 
-                it = self.table.item(row_idx, 1)
-                if it is None:
-                    it = QTableWidgetItem("")
-                    it.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                    self.table.setItem(row_idx, 1, it)
-                it.setText(r.name)
-
-                it = self.table.item(row_idx, 2)
-                if it is None:
-                    it = QTableWidgetItem("")
-                    it.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                    self.table.setItem(row_idx, 2, it)
-                it.setText(r.os)
-
-                it = self.table.item(row_idx, 3)
-                if it is None:
-                    it = QTableWidgetItem("")
-                    it.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                    self.table.setItem(row_idx, 3, it)
+                self._ensure_cell_item(row_idx, 1).setText(r.name)
+                self._ensure_cell_item(row_idx, 2).setText(r.os)
+
+                it = self._ensure_cell_item(row_idx, 3)
                 it.setText(r.status)
                 if r.status == "running":
                     it.setBackground(Qt.darkGreen)
@@ -2916,12 +3218,7 @@ class MainWindow(QMainWindow):
                     it.setForeground(Qt.white)
 
                 proxy_text = getattr(r, "proxy_display", "") or ""
-                it = self.table.item(row_idx, 4)
-                if it is None:
-                    it = QTableWidgetItem("")
-                    it.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                    self.table.setItem(row_idx, 4, it)
-                it.setText(proxy_text)
+                self._ensure_cell_item(row_idx, 4).setText(proxy_text)
 
                 wmap = self._get_or_create_row_widgets(rid)
                 self.table.setCellWidget(row_idx, 0, wmap.get("chk_w"))
@@ -2953,7 +3250,9 @@ class MainWindow(QMainWindow):
                     if btn_del: btn_del.setEnabled(True)
                     if btn_stop: btn_stop.setEnabled(False)
 
+            self._last_selection_active = None
             self._update_selection_ui()
+            self._adapt_refresh_interval()
         except Exception:
 
             try:
@@ -2971,7 +3270,19 @@ class MainWindow(QMainWindow):
     def resume_refresh(self):
         try:
             if hasattr(self, "timer") and (not self.timer.isActive()):
-                self.timer.start(2000)
+                self.timer.start()
+        except Exception:
+            pass
+
+    def _adapt_refresh_interval(self):
+        """Poll runtime state quickly only while at least one profile is running."""
+        try:
+            if not hasattr(self, "timer"):
+                return
+            running = sum(1 for r in (self._table_rows or []) if r.status == "running")
+            interval = self.REFRESH_ACTIVE_MS if running else self.REFRESH_IDLE_MS
+            if self.timer.interval() != interval:
+                self.timer.setInterval(interval)
         except Exception:
             pass
 
@@ -2982,6 +3293,8 @@ class MainWindow(QMainWindow):
                 return
         except Exception:
             pass
+        if (not self.isVisible()) or self.isMinimized():
+            return
         try:
             changed_ids = self.pm.sync_runtime_states()
             if changed_ids:
@@ -2992,6 +3305,15 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    def hideEvent(self, event: QtGui.QHideEvent):
+        super().hideEvent(event)
+        self.pause_refresh()
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        if not getattr(self, "_bulk_busy", False):
+            self.resume_refresh()
+
     def _on_profile_exited(self, profile_id):
         try:
             self._refresh_rows_by_ids([str(profile_id)])
@@ -3052,7 +3374,12 @@ class MainWindow(QMainWindow):
 
             self.table.setUpdatesEnabled(False)
             self.table.blockSignals(True)
-            self.table.setRowCount(len(rows))
+            cur_count = self.table.rowCount()
+            new_count = len(rows)
+            if new_count < cur_count:
+                self.table.model().removeRows(new_count, cur_count - new_count)
+            elif new_count > cur_count:
+                self.table.model().insertRows(cur_count, new_count - cur_count)
 
             for i, r in enumerate(rows):
 
@@ -3083,34 +3410,21 @@ class MainWindow(QMainWindow):
 
                 self.table.setCellWidget(i, 0, cell_w)
 
-                item_name = QTableWidgetItem(r.name)
-                item_name.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                self.table.setItem(i, 1, item_name)
-
-                item_os = QTableWidgetItem(r.os)
-                item_os.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                self.table.setItem(i, 2, item_os)
+                self._ensure_cell_item(i, 1).setText(r.name)
+                self._ensure_cell_item(i, 2).setText(r.os)
 
-                item_status = QTableWidgetItem(r.status)
-                item_status.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                self.table.setItem(i, 3, item_status)
-
-                status_item = self.table.item(i, 3)
-                if status_item:
-                    if r.status == "running":
-                        status_item.setBackground(Qt.darkGreen)
-                        status_item.setForeground(Qt.white)
-                    else:
-                        status_item.setBackground(Qt.transparent)
-                        status_item.setForeground(Qt.white)
+                status_item = self._ensure_cell_item(i, 3)
+                status_item.setText(r.status)
+                if r.status == "running":
+                    status_item.setBackground(Qt.darkGreen)
+                    status_item.setForeground(Qt.white)
+                else:
+                    status_item.setBackground(Qt.transparent)
+                    status_item.setForeground(Qt.white)
 
                 proxy_text = getattr(r, "proxy_display", "") or ""
-                item_proxy = QTableWidgetItem(proxy_text)
-
-                item_proxy.setTextAlignment(Qt.AlignVCenter | Qt.AlignHCenter)
-                self.table.setItem(i, 4, item_proxy)
+                self._ensure_cell_item(i, 4).setText(proxy_text)
 
-                wmap = self._get_or_create_row_widgets(rid)
                 w = wmap.get("actions_w")
 
                 btn_start = wmap.get("btn_start")
@@ -3145,7 +3459,9 @@ class MainWindow(QMainWindow):
             self._reloading_table = False
 
         self.apply_column_widths()
+        self._last_selection_active = None
         self._update_selection_ui()
+        self._adapt_refresh_interval()
 
     def _make_center_checkbox_widget(self, rid: str, checked: bool, enabled: bool):
         """Create a centered checkbox widget for table cell (row select)."""
@@ -3238,7 +3554,10 @@ class MainWindow(QMainWindow):
 
         selection_active = (n > 0)
         try:
-            for r in (self._table_rows or []):
+            # Row buttons only change when the selection crosses the 0 <-> >0 boundary.
+            # Callers that rewrite button states themselves reset _last_selection_active to None.
+            rows_to_sync = () if selection_active == self._last_selection_active else (self._table_rows or [])
+            for r in rows_to_sync:
                 rid = str(getattr(r, 'id', ''))
                 wmap = self._row_widgets.get(rid)
                 if not wmap:
@@ -3269,8 +3588,9 @@ class MainWindow(QMainWindow):
                         if btn_edit is not None and shiboken6.isValid(btn_edit): btn_edit.setEnabled(True)
                         if btn_del is not None and shiboken6.isValid(btn_del): btn_del.setEnabled(True)
                         if btn_stop is not None and shiboken6.isValid(btn_stop): btn_stop.setEnabled(False)
+            self._last_selection_active = selection_active
         except Exception:
-            pass
+            self._last_selection_active = None
 
         try:
             hdr = self.table.horizontalHeader()
@@ -3342,6 +3662,38 @@ class MainWindow(QMainWindow):
 
         self._update_selection_ui()
 
+    def _begin_bulk(self, *controls) -> tuple:
+        """
+        Common prologue for bulk runs: disable the given controls, pause refresh
+        and freeze table painting. Returns a token to hand to _end_bulk().
+        """
+        for w in controls:
+            try:
+                w.setEnabled(False)
+            except Exception:
+                pass
+        self._bulk_busy = True
+        self.pause_refresh()
+        self._ensure_bulk_runner()
+        try:
+            self.table.viewport().setUpdatesEnabled(False)
+        except Exception:
+            pass
+        return controls
+
+    def _end_bulk(self, token: tuple, summary: dict = None):
+        """Runner completion hook: undo _begin_bulk() before the finished handler reloads."""
+        try:
+            self.table.viewport().setUpdatesEnabled(True)
+        except Exception:
+            pass
+        for w in token or ():
+            try:
+                w.setEnabled(True)
+            except Exception:
+                pass
+        self._bulk_busy = False
+
     def _ensure_bulk_runner(self):
         if not hasattr(self, "_bulk_runner") or self._bulk_runner is None:
             self._bulk_runner = BulkRunner(self)
@@ -3358,15 +3710,6 @@ class MainWindow(QMainWindow):
 
     def _on_bulk_finished(self, summary: dict):
 
-        try:
-            self.table.setEnabled(True)
-        except Exception:
-            pass
-        try:
-            self.btn_bulk_apply.setEnabled(True)
-        except Exception:
-            pass
-
         try:
             self.setWindowTitle("GoLoginOffline (MVP - Profiles)")
         except Exception:
@@ -3375,31 +3718,23 @@ class MainWindow(QMainWindow):
         action = summary.get("action")
         done = int(summary.get("done", 0) or 0)
 
-        if action == "delete" and done > 0:
-            try:
-                self.selected_ids.clear()
-            except Exception:
-                pass
-            try:
-                self._row_widgets.clear()
-            except Exception:
-                pass
-            try:
-                self._row_index_by_id.clear()
-            except Exception:
-                pass
+        if action == "create":
+            get_app_logger().info(f"[ui] Created {done} profile(s)")
 
-        if action in ("clean_proxy", "start", "stop") and done > 0:
+        if action in ("delete", "clean_proxy", "start", "stop") and done > 0:
             self.selected_ids.clear()
 
-        self.reload_table()
+        try:
+            self._apply_bulk_diff(summary)
+        except Exception:
+            self._row_widgets.clear()
+            self._row_index_by_id.clear()
+            self.reload_table()
 
-        self._bulk_busy = False
         if getattr(self, "_pending_apply_widths", False):
             self._pending_apply_widths = False
             try:
                 self.apply_column_widths()
-                QtWidgets.QApplication.processEvents()
             except Exception:
                 pass
 
@@ -3423,7 +3758,6 @@ class MainWindow(QMainWindow):
             try:
 
                 self.table.viewport().update()
-                QtWidgets.QApplication.processEvents()
             except Exception:
                 pass
 
@@ -3431,7 +3765,47 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _apply_bulk_diff(self, summary: dict):
+        """
+        Update the table from a finished bulk run without a full rebuild:
+        deleted rows are removed in place, touched rows are refreshed by id.
+        """
+        if summary.get("action") == "create":
+            self.reload_table()
+            return
+
+        deleted = [str(x) for x in (summary.get("deleted") or [])]
+        changed = [str(x) for x in (summary.get("changed") or [])]
+
+        if deleted:
+            gone = set(deleted)
+            self._reloading_table = True
+            self.table.setUpdatesEnabled(False)
+            try:
+                for idx in sorted((self._row_index_by_id[rid] for rid in gone if rid in self._row_index_by_id), reverse=True):
+                    self.table.removeRow(idx)
+                for rid in gone:
+                    self._row_widgets.pop(rid, None)
+                    self.selected_ids.discard(rid)
+                self._table_rows = [r for r in self._table_rows if str(r.id) not in gone]
+                self._row_by_id = {str(r.id): r for r in self._table_rows}
+                self._row_index_by_id = {str(r.id): i for i, r in enumerate(self._table_rows)}
+            finally:
+                self.table.setUpdatesEnabled(True)
+                self._reloading_table = False
+
+        if changed:
+            self._refresh_rows_by_ids(changed)
+        else:
+            self._last_selection_active = None
+            self._update_selection_ui()
+            self._adapt_refresh_interval()
+
     def _bulk_rows_guard(self) -> List[ProfileRow]:
+        # Checked before _begin_bulk(): a refused run must not touch the active run's UI state
+        if getattr(self, "_bulk_busy", False):
+            QMessageBox.information(self, "Busy", "Another bulk action is still running. Try again when it finishes.")
+            return []
         rows = self._selected_rows()
         if not rows:
             QMessageBox.information(self, "Notification", "No selected profiles.")
@@ -3471,20 +3845,9 @@ class MainWindow(QMainWindow):
         if ok != QMessageBox.Yes:
             return
 
-        try:
-            self.table.setEnabled(False)
-        except Exception:
-            pass
-        try:
-            self.btn_bulk_apply.setEnabled(False)
-        except Exception:
-            pass
-
-        self._bulk_busy = True
-        self.pause_refresh()
-        self._ensure_bulk_runner()
 
         def _fn(row: ProfileRow, summary: dict):
+            summary.setdefault("changed", []).append(str(row.id))
             if row.status == "running":
                 summary.setdefault("skipped", []).append((row.id, "already running"))
                 return f"skip {row.id}"
@@ -3502,7 +3865,8 @@ class MainWindow(QMainWindow):
                 return f"error {row.id}"
 
         summary = {"action": "start", "done": 0, "total": len(rows)}
-        self._bulk_runner.start(rows, per_tick=1, fn=_fn, summary=summary)
+        token = self._begin_bulk(self.table, self.btn_bulk_apply)
+        self._bulk_runner.start(rows, per_tick=1, fn=_fn, summary=summary, on_finished=lambda s: self._end_bulk(token, s))
 
     def on_bulk_stop(self):
         rows = self._bulk_rows_guard()
@@ -3520,20 +3884,9 @@ class MainWindow(QMainWindow):
         if ok != QMessageBox.Yes:
             return
 
-        try:
-            self.table.setEnabled(False)
-        except Exception:
-            pass
-        try:
-            self.btn_bulk_apply.setEnabled(False)
-        except Exception:
-            pass
-        self._bulk_busy = True
-
-        self.pause_refresh()
-        self._ensure_bulk_runner()
 
         def _fn(row: ProfileRow, summary: dict):
+            summary.setdefault("changed", []).append(str(row.id))
             if row.status != "running":
                 summary.setdefault("skipped", []).append((row.id, "not running"))
                 return f"skip {row.id}"
@@ -3546,7 +3899,8 @@ class MainWindow(QMainWindow):
                 return f"error {row.id}"
 
         summary = {"action": "stop", "done": 0, "total": len(rows)}
-        self._bulk_runner.start(rows, per_tick=1, fn=_fn, summary=summary)
+        token = self._begin_bulk(self.table, self.btn_bulk_apply)
+        self._bulk_runner.start(rows, per_tick=1, fn=_fn, summary=summary, on_finished=lambda s: self._end_bulk(token, s))
 
     def on_bulk_clean_proxy(self):
         rows = self._bulk_rows_guard()
@@ -3564,53 +3918,55 @@ class MainWindow(QMainWindow):
         if ok != QMessageBox.Yes:
             return
 
-        try:
-            self.table.setEnabled(False)
-        except Exception:
-            pass
-        try:
-            self.btn_bulk_apply.setEnabled(False)
-        except Exception:
-            pass
-        self._bulk_busy = True
 
-        self.pause_refresh()
-        self._ensure_bulk_runner()
+        profile_root = self.storage.profile_root
 
-        def _fn(row: ProfileRow, summary: dict):
-            try:
-                pdir = self.storage.profile_root / row.folder
-                prof_path = pdir / "profile.json"
-                prof = load_json(prof_path, {})
-                prof["proxy"] = {
-                    "enabled": False,
-                    "type": "http",
-                    "host": "",
-                    "port": None,
-                    "username": "",
-                    "password": "",
-                }
-                prof["updatedAt"] = now_iso()
-                save_json(prof_path, prof)
+        # Runs on a pool thread: touches only this row's profile.json.
+        def _work(row: ProfileRow):
+            prof_path = profile_root / row.folder / "profile.json"
+            prof = load_json(prof_path, {})
+            prof["proxy"] = {
+                "enabled": False,
+                "type": "http",
+                "host": "",
+                "port": None,
+                "username": "",
+                "password": "",
+            }
+            prof["updatedAt"] = now_iso()
+            save_json(prof_path, prof)
+            return f"clean proxy {row.id}"
 
-                try:
-                    ps = self.pm._read_index_profiles()
-                    for p in ps:
-                        if str(p.get("id")) == str(row.id):
-                            p["proxyDisplay"] = ""
-                            break
-                    self.pm._write_index(ps)
-                except Exception:
-                    pass
+        def _merge(row: ProfileRow, result, err: str, summary: dict):
+            summary.setdefault("changed", []).append(str(row.id))
+            if err:
+                summary.setdefault("errors", []).append((row.id, err))
+                return
+            summary.setdefault("cleaned", set()).add(str(row.id))
+            summary["done"] = summary.get("done", 0) + 1
 
-                summary["done"] = summary.get("done", 0) + 1
-                return f"clean proxy {row.id}"
-            except Exception as e:
-                summary.setdefault("errors", []).append((row.id, str(e)))
-                return f"error {row.id}"
+        def _on_finished(summary: dict):
+            snap = self.pm._index_snapshot
+            try:
+                cleaned = summary.get("cleaned") or set()
+                if cleaned:
+                    with self.pm._index_lock:
+                        ps = self.pm._read_index_profiles()
+                        for p in ps:
+                            if str(p.get("id")) in cleaned:
+                                p["proxyDisplay"] = ""
+                        self.pm._write_index(ps)
+            except Exception:
+                pass
+            finally:
+                snap.end()
+            self._end_bulk(token, summary)
 
         summary = {"action": "clean_proxy", "done": 0, "total": len(rows)}
-        self._bulk_runner.start(rows, per_tick=10, fn=_fn, summary=summary)
+        token = self._begin_bulk(self.table, self.btn_bulk_apply)
+        # Snapshot opens only once the runner took the job, so _on_finished always closes it
+        if self._bulk_runner.start_pooled(rows, work=_work, merge=_merge, summary=summary, on_finished=_on_finished):
+            self.pm._index_snapshot.begin()
 
     def on_bulk_delete(self):
         rows = self._bulk_rows_guard()
@@ -3628,39 +3984,51 @@ class MainWindow(QMainWindow):
         if ok != QMessageBox.Yes:
             return
 
-        try:
-            self.table.setEnabled(False)
-        except Exception:
-            pass
-        try:
-            self.btn_bulk_apply.setEnabled(False)
-        except Exception:
-            pass
-        self._bulk_busy = True
-
-        self.pause_refresh()
-        self._ensure_bulk_runner()
 
-        def _fn(row: ProfileRow, summary: dict):
-            if row.status == "running":
-                summary.setdefault("skipped", []).append((row.id, "running"))
-                return f"skip {row.id}"
-            try:
-                self.pm.delete_profile(row)
+        # One delete_profiles() call (one index write) per tick
+        batches = [rows[i:i + self.DELETE_BATCH] for i in range(0, len(rows), self.DELETE_BATCH)]
 
-                self.selected_ids.discard(str(row.id))
-                summary["done"] = summary.get("done", 0) + 1
-                return f"delete {row.id}"
-            except Exception as e:
-                summary.setdefault("errors", []).append((row.id, str(e)))
-                return f"error {row.id}"
+        def _fn(batch, summary: dict):
+            todo = []
+            for row in batch:
+                if row.status == "running":
+                    summary.setdefault("skipped", []).append((row.id, "running"))
+                    summary.setdefault("changed", []).append(str(row.id))
+                else:
+                    todo.append(row)
+            if not todo:
+                return f"skip {len(batch)}"
+
+            deleted, errors = self.pm.delete_profiles(todo)
+            gone = set(deleted)
+            for row in todo:
+                rid = str(row.id)
+                if row.id in gone:
+                    self.selected_ids.discard(rid)
+                    summary.setdefault("deleted", []).append(rid)
+                    summary["done"] = summary.get("done", 0) + 1
+                else:
+                    prefix = f"{row.id}: "
+                    msg = next((m[len(prefix):] for m in errors if m.startswith(prefix)), "delete failed")
+                    summary.setdefault("errors", []).append((row.id, msg))
+                    summary.setdefault("changed", []).append(rid)
+            return f"delete {len(gone)}"
 
         summary = {"action": "delete", "done": 0, "total": len(rows)}
-        self._bulk_runner.start(rows, per_tick=3, fn=_fn, summary=summary)
+        def _on_finished(summary: dict):
+            self.pm._index_snapshot.end()
+            self._end_bulk(token, summary)
+
+        token = self._begin_bulk(self.table, self.btn_bulk_apply)
+        if self._bulk_runner.start(batches, per_tick=1, fn=_fn, summary=summary, on_finished=_on_finished, batched=True):
+            self.pm._index_snapshot.begin()
 
     def apply_column_widths(self):
 
         total = self.table.viewport().width()
+        if total == self._last_viewport_w:
+            return
+        self._last_viewport_w = total
 
         sel_w = 36
         actions_min = 360
@@ -3683,7 +4051,8 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.apply_column_widths()
+        # Coalesce a drag's worth of resize events into one layout pass.
+        self._resize_timer.start()
 
     def on_create(self):
         dlg = ProfileEditorDialog(
@@ -3717,81 +4086,41 @@ class MainWindow(QMainWindow):
         if qty < 1:
             qty = 1
 
-        created = 0
-
-        base_title = self.windowTitle()
-
-        if qty > 1:
-            try:
-                self.table.setEnabled(False)
-            except Exception:
-                pass
-            try:
-                self.btn_create.setEnabled(False)
-            except Exception:
-                pass
-            try:
-                self.btn_bulk_apply.setEnabled(False)
-            except Exception:
-                pass
-
-        try:
-
-            if qty == 1:
-                if not name:
-                    QMessageBox.warning(self, "Invalid", "Name is required.")
-                    return
-
-                row_created = self.pm.create_profile(name, os_name)
-                self.pm.update_profile(row_created, name, os_name, notes, proxy, webrtc)
-                created = 1
-
-            else:
-                stamp = time.strftime("%Y%m%d_%H%M%S")
-
-                for i in range(1, qty + 1):
-                    rnd = uuid.uuid4().hex[:6].upper()
-                    pname = f"Profile_{stamp}_{i:03d}_{rnd}"
-
-                    row_created = self.pm.create_profile(pname, os_name)
-                    self.pm.update_profile(row_created, pname, os_name, notes, proxy, webrtc)
-                    created += 1
+        if qty == 1:
+            if not name:
+                QMessageBox.warning(self, "Invalid", "Name is required.")
+                return
 
-                    if (i % 1) == 0 or i == qty:
-                        try:
-                            self.setWindowTitle(f"{base_title}  |  Creating... {i}/{qty}")
-                        except Exception:
-                            pass
-                        try:
+            row_created = self.pm.create_profile(name, os_name)
+            self.pm.update_profile(row_created, name, os_name, notes, proxy, webrtc)
 
-                            QApplication.processEvents(QtCore.QEventLoop.ExcludeUserInputEvents)
-                        except Exception:
-                            pass
+            get_app_logger().info("[ui] Created 1 profile(s)")
 
-        finally:
+            self.reload_table()
+            return
 
-            if qty > 1:
-                try:
-                    self.table.setEnabled(True)
-                except Exception:
-                    pass
-                try:
-                    self.btn_create.setEnabled(True)
-                except Exception:
-                    pass
-                try:
-                    self.btn_bulk_apply.setEnabled(True)
-                except Exception:
-                    pass
+        if getattr(self, "_bulk_busy", False):
+            QMessageBox.information(self, "Busy", "Another bulk action is still running. Try again when it finishes.")
+            return
 
-            try:
-                self.setWindowTitle(base_title)
-            except Exception:
-                pass
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        rnds = [base64.b32encode(os.urandom(4)).decode("ascii")[:6] for _ in range(qty)]
+        names = [f"Profile_{stamp}_{i:03d}_{r}" for i, r in enumerate(rnds, 1)]
+        specs = [
+            {"name": pname, "os": os_name, "notes": notes, "proxy": proxy, "webrtc": webrtc, "fingerprint": fp}
+            for pname, fp in zip(names, generate_fingerprints(qty, os_name))
+        ]
+        # One create_profiles_bulk call (one index write) per tick
+        batches = [specs[i:i + self.CREATE_BATCH] for i in range(0, len(specs), self.CREATE_BATCH)]
 
-        get_app_logger().info(f"[ui] Created {created} profile(s)")
+        def _fn(batch, summary: dict):
+            created = self.pm.create_profiles_bulk(batch)
+            summary["done"] = summary.get("done", 0) + len(created)
+            return f"create {len(created)}"
 
-        self.reload_table()
+        summary = {"action": "create", "done": 0, "total": qty}
+        token = self._begin_bulk(self.table, self.btn_create, self.btn_bulk_apply)
+        self._bulk_runner.start(batches, per_tick=1, fn=_fn, summary=summary, on_finished=lambda s: self._end_bulk(token, s), batched=True)
 
     def on_settings(self):
         dlg = SettingsDialog(self)
@@ -2,12 +2,21 @@
 # IMPORTS
 # ============================================================================
 
+import os
 import json
+import logging
 import random
+import re
 import shutil
-import base64
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson là tùy chọn, thiếu thì dùng json chuẩn
+    orjson = None
+
 # ============================================================================
 # CONSTANTS & DATABASES
 # ============================================================================
@@ -23,6 +32,19 @@ MAC_UAS = [
     "Mozilla/5.0 (Macintosh; Arm Mac OS X 14_2_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
 ]
 
+_CHROME_RE = re.compile(r"Chrome/(\d+)")
+
+def _ua_pool(uas: list) -> list:
+    # Tách version một lần lúc import thay vì regex mỗi lần generate
+    pool = []
+    for ua in uas:
+        m = _CHROME_RE.search(ua)
+        pool.append({"ua": ua, "major": m.group(1) if m else "120"})
+    return pool
+
+WIN_UA_POOL = _ua_pool(WIN_UAS)
+MAC_UA_POOL = _ua_pool(MAC_UAS)
+
 WEBGL_WIN_POOL = [
     {"vendor": "Google Inc. (NVIDIA)", "renderer": "ANGLE (NVIDIA, NVIDIA GeForce GTX 1650 Direct3D11 vs_5_0 ps_5_0, D3D11)"},
     {"vendor": "Google Inc. (NVIDIA)", "renderer": "ANGLE (NVIDIA, NVIDIA GeForce RTX 3060 Direct3D11 vs_5_0 ps_5_0, D3D11)"},
@@ -52,98 +74,137 @@ SCREEN_RESOLUTIONS = [
 # FINGERPRINT CONFIG GENERATION
 # ============================================================================
 
+CANVAS_NOISE_STEPS = [-3, -2, -1, 1, 2, 3]
+CPU_CORES = [4, 8, 12, 16]
+RAM_SIZES = [4, 8, 16, 32]
+
+@lru_cache(maxsize=4)
+def _static_for_os(os_type: str) -> tuple:
+    """(platform, webgl_pool, ua_pool) cố định theo hệ điều hành."""
+    if "mac" in os_type.lower():
+        return "MacIntel", WEBGL_MAC_POOL, MAC_UA_POOL
+    return "Win32", WEBGL_WIN_POOL, WIN_UA_POOL
+
 def generate_fingerprint(os_type: str):
-    is_mac = "mac" in os_type.lower()
-    
+    return generate_fingerprints(1, os_type)[0]
+
+def generate_fingerprints(n: int, os_type: str) -> list:
+    """
+    Sinh n fingerprint trong một lượt (dùng khi tạo profile hàng loạt).
+    Các lựa chọn rời rạc được bốc một lần bằng random.choices(k=...) thay vì gọi lẻ từng profile.
+    """
+    n = max(0, int(n))
+
     # 1. User Agent & Platform
-    if is_mac:
-        ua = random.choice(MAC_UAS)
-        platform = "MacIntel"
-        webgl_pool = WEBGL_MAC_POOL
-    else:
-        ua = random.choice(WIN_UAS)
-        platform = "Win32"
-        webgl_pool = WEBGL_WIN_POOL
-
-    # 2. Canvas Noise Config - Tăng entropy
-    def _nz(): return random.choice([-3, -2, -1, 1, 2, 3])
-    
-    canvas_noise = {
-        "salt": random.randint(100000, 999999),
-        "r": _nz(), 
-        "g": _nz(), 
-        "b": _nz(),
-        # Thêm các tham số để tạo unique signature
-        "variant": random.randint(1, 100),  # Biến thể
-        "multiplier": random.uniform(0.8, 1.2)  # Hệ số nhân
-    }
+    platform, webgl_pool, ua_pool = _static_for_os(os_type)
 
-    # [PATCH 1] Audio Noise: Tăng biên độ mạnh (0.001 - 0.01) để fix trùng Iphey
-    audio_noise = random.uniform(0.001, 0.01)
-
-    # 4. Screen Resolution
-    screen = random.choice(SCREEN_RESOLUTIONS)
-    # availHeight thường nhỏ hơn height do thanh taskbar (Win) hoặc dock (Mac)
-    avail_diff = random.randint(30, 60)
-    screen_conf = {
-        "width": screen["width"],
-        "height": screen["height"],
-        "availHeight": screen["height"] - avail_diff,
-        "availWidth": screen["width"],
-        "colorDepth": 24,
-        "pixelDepth": 24
-    }
+    choices = random.choices
+    randint = random.randint
+    uniform = random.uniform
 
-    # 5. Hardware Concurrency & Memory
-    cores = random.choice([4, 8, 12, 16])
-    ram = random.choice([4, 8, 16, 32])
-
-    # [PATCH 1] Tách version động từ chuỗi UA (Không hardcode)
-    import re
-    ua_major = "120" # Giá trị mặc định an toàn
-    match = re.search(r"Chrome/(\d+)", ua)
-    if match:
-        ua_major = match.group(1)
-
-    nav_config = {
-        "userAgent": ua,
-        "uaVersion": ua_major, # Truyền version chính xác xuống JS
-        "platform": platform,
-        "hardwareConcurrency": cores,
-        "deviceMemory": ram,
-        "maxTouchPoints": 0,
-        "webdriver": False,
-        "appVersion": ua.replace("Mozilla/", "")
-    }
-        
-    return {
-        "userAgent": ua,
-        "canvasNoise": canvas_noise,
-        "webgl": random.choice(webgl_pool),
-        "audioNoise": random.uniform(0.0001, 0.0005), # [PATCH 2] Tăng noise để khác Hash
-        "screen": screen_conf,
-        "navigator": nav_config,
-        "clientRectsNoise": random.uniform(0.2, 1.2), # [PATCH 2] Tăng noise Rects mạnh hơn
-    }
+    ua_entries = choices(ua_pool, k=n)
+    nz = choices(CANVAS_NOISE_STEPS, k=3 * n)
+    screens = choices(SCREEN_RESOLUTIONS, k=n)
+    cores_list = choices(CPU_CORES, k=n)
+    ram_list = choices(RAM_SIZES, k=n)
+    webgls = choices(webgl_pool, k=n)
+
+    out = []
+    for i in range(n):
+        ua_entry = ua_entries[i]
+        ua = ua_entry["ua"]
+
+        # 2. Canvas Noise Config - Tăng entropy
+        canvas_noise = {
+            "salt": randint(100000, 999999),
+            "r": nz[3 * i],
+            "g": nz[3 * i + 1],
+            "b": nz[3 * i + 2],
+            # Thêm các tham số để tạo unique signature
+            "variant": randint(1, 100),  # Biến thể
+            "multiplier": uniform(0.8, 1.2)  # Hệ số nhân
+        }
+
+        # 4. Screen Resolution
+        screen = screens[i]
+        # availHeight thường nhỏ hơn height do thanh taskbar (Win) hoặc dock (Mac)
+        avail_diff = randint(30, 60)
+        screen_conf = {
+            "width": screen["width"],
+            "height": screen["height"],
+            "availHeight": screen["height"] - avail_diff,
+            "availWidth": screen["width"],
+            "colorDepth": 24,
+            "pixelDepth": 24
+        }
+
+        # [PATCH 1] Version đã tách sẵn từ chuỗi UA (Không hardcode)
+        nav_config = {
+            "userAgent": ua,
+            "uaVersion": ua_entry["major"], # Truyền version chính xác xuống JS
+            "platform": platform,
+            "hardwareConcurrency": cores_list[i],
+            "deviceMemory": ram_list[i],
+            "maxTouchPoints": 0,
+            "webdriver": False,
+            "appVersion": ua.replace("Mozilla/", "")
+        }
+
+        out.append({
+            "userAgent": ua,
+            "canvasNoise": canvas_noise,
+            "webgl": webgls[i],
+            "audioNoise": uniform(0.0001, 0.0005), # [PATCH 2] Tăng noise để khác Hash
+            "screen": screen_conf,
+            "navigator": nav_config,
+            "clientRectsNoise": uniform(0.2, 1.2), # [PATCH 2] Tăng noise Rects mạnh hơn
+        })
+
+    return out
 
 # ============================================================================
 # EXTENSION BUILD HELPERS
 # ============================================================================
 
-def _save_json(path: Path, data: dict):
+def _json_bytes(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _atomic_write_bytes(path: Path, buf: bytes):
+    # Ghi ra file tạm tên riêng (mkstemp) rồi os.replace -> không để lại file ghi dở,
+    # hai lượt build cùng lúc cũng không đè file tạm của nhau
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
+
+def _write_files(base_dir: Path, files: dict):
+    # Gom toàn bộ nội dung đã encode sẵn rồi ghi một lượt cho cả extension
+    for name, buf in files.items():
+        _atomic_write_bytes(base_dir / name, buf)
+
+def _save_json(path: Path, data: dict):
+    _atomic_write_bytes(path, json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+
+# Cùng tên logger với get_app_logger() bên core (không import core để tránh vòng lặp import)
+_log = logging.getLogger("gologin_app")
 
 def append_load_extension_arg(args: list, ext_dir: Path) -> None:
-    import os
     abs_path = os.path.abspath(str(ext_dir))
     
     # Debug
-    print(f"DEBUG PATH: {abs_path}")
+    _log.debug("load-extension path=%s", abs_path)
     
-    # Xóa flag cũ
-    args[:] = [a for a in args if not str(a).startswith("--load-extension=")]
-    args[:] = [a for a in args if not str(a).startswith("--disable-extensions-except=")]
+    # Xóa flag cũ (một lượt duyệt cho cả hai flag)
+    stale = ("--load-extension=", "--disable-extensions-except=")
+    args[:] = [a for a in args if not str(a).startswith(stale)]
 
     # QUAN TRỌNG: Không dùng disable-extensions-except nữa (vì đã sạch policy)
     # Chỉ dùng load-extension
@@ -153,14 +214,8 @@ def append_load_extension_arg(args: list, ext_dir: Path) -> None:
 # EXTENSION BUILD PIPELINE
 # ============================================================================
 
-def build_profile_extension(ext_path: Path, fingerprint: dict, webrtc_mode: str, 
-                          timezone: str = "", public_ip: str = "", 
-                          extra_scripts: dict = None) -> Path:
-    if ext_path.exists(): shutil.rmtree(ext_path, ignore_errors=True)
-    ext_path.mkdir(parents=True, exist_ok=True)
-    
-
-    reload_code = r"""
+# reload.js / background.js không phụ thuộc profile -> encode sẵn một lần lúc import
+_RELOAD_BYTES = r"""
     (function() {
         try {
             const key = "smcd_loaded_v1";
@@ -178,15 +233,9 @@ def build_profile_extension(ext_path: Path, fingerprint: dict, webrtc_mode: str,
             }
         } catch(e) {}
     })();
-    """
-    (ext_path / "reload.js").write_text(reload_code, encoding="utf-8")
+    """.encode("utf-8")
 
-    spoofer_code = _build_spoofer_code(fingerprint, webrtc_mode, timezone, public_ip)
-    (ext_path / "spoofer.js").write_text(spoofer_code, encoding="utf-8")
-    
-
-    policy_val = 'disable_non_proxied_udp' if public_ip else 'default'
-    bg_code = f"""
+_BG_TEMPLATE = """
     try {{
         if (chrome.privacy && chrome.privacy.network && chrome.privacy.network.webRTCIPHandlingPolicy) {{
             chrome.privacy.network.webRTCIPHandlingPolicy.set({{
@@ -195,14 +244,34 @@ def build_profile_extension(ext_path: Path, fingerprint: dict, webrtc_mode: str,
         }}
     }} catch(e) {{ console.error("BG Policy Error", e); }}
     """
-    (ext_path / "background.js").write_text(bg_code, encoding="utf-8")
+_BG_BYTES_DEFAULT = _BG_TEMPLATE.format(policy_val="default").encode("utf-8")
+_BG_BYTES_DISABLE_UDP = _BG_TEMPLATE.format(policy_val="disable_non_proxied_udp").encode("utf-8")
+
+def build_profile_extension(ext_path: Path, fingerprint: dict, webrtc_mode: str, 
+                          timezone: str = "", public_ip: str = "", 
+                          extra_scripts: dict = None) -> Path:
+    if ext_path.exists(): shutil.rmtree(ext_path, ignore_errors=True)
+
+    ext_path.mkdir(parents=True, exist_ok=True)
+    # File tĩnh ghi thẳng từ bytes dựng sẵn lúc import
+    files = {
+        "reload.js": _RELOAD_BYTES,
+        "background.js": _BG_BYTES_DISABLE_UDP if public_ip else _BG_BYTES_DEFAULT,
+    }
 
-    js_files = ["reload.js", "spoofer.js"]
+    js_files = ["reload.js"]
+
+    spoofer_code = _build_spoofer_code(fingerprint, webrtc_mode, timezone, public_ip)
+    if spoofer_code:
+        files["spoofer.js"] = spoofer_code.encode("utf-8")
+        js_files.append("spoofer.js")
     
+    # Script phụ (badge UI) chỉ cần ở top frame -> entry riêng, Chrome không tiêm vào từng iframe
+    top_js_files = []
     if extra_scripts:
         for filename, content in extra_scripts.items():
-            (ext_path / filename).write_text(content, encoding="utf-8")
-            js_files.append(filename)
+            files[filename] = content.encode("utf-8")
+            top_js_files.append(filename)
 
     manifest = {
         "manifest_version": 3,
@@ -222,37 +291,31 @@ def build_profile_extension(ext_path: Path, fingerprint: dict, webrtc_mode: str,
             }
         ]
     }
-    _save_json(ext_path / "manifest.json", manifest)
+    if top_js_files:
+        manifest["content_scripts"].append({
+            "matches": ["<all_urls>"],
+            "js": top_js_files,
+            "run_at": "document_start",
+            "all_frames": False,
+            "world": "MAIN"
+        })
+    files["manifest.json"] = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+
+    _write_files(ext_path, files)
     return ext_path
 
 # ============================================================================
 # CONTENT SCRIPT SPOOFER GENERATION
 # ============================================================================
 
-def _build_spoofer_code(fp: dict, webrtc_mode: str, timezone: str, public_ip: str = "") -> str:
-
-    wm = (webrtc_mode or "altered").strip().lower()
-    if wm not in ("altered", "disabled"): wm = "altered"
-
-    config_payload = {
-        "WEBRTC_MODE": wm,
-        "PUBLIC_IP": public_ip,
-        "TZ": timezone or "",
-        "CANVAS": fp.get("canvasNoise", {}),
-        "WEBGL": fp.get("webgl", {}),
-        "NAV": None,
-        "AUDIO": fp.get("audioNoise", 0.0000001),
-        "RECTS": fp.get("clientRectsNoise", 0),
-    }
+# Template JS được chia thành từng mảnh; Python chỉ ghép các mảnh cần cho cấu hình hiện tại
+# (nhánh nào chắc chắn không chạy thì không gửi xuống trang nữa)
 
-    json_str = json.dumps(config_payload)
-    b64_config = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
-    
-    return r"""(function() {
+# Khung mở đầu: CONFIG + helper protect()
+_SPOOFER_JS_HEAD = r"""(function() {
     'use strict';
     try {
-        const B64_CONFIG = "___B64_CONFIG___";
-        const CONFIG = JSON.parse(atob(B64_CONFIG));
+        const CONFIG = ___CONFIG_JSON___;
         
         // [PATCH] Protect Function Upgrade: Hỗ trợ Getter để Fix lỗi Iphey Red
         const protect = (fn, name, isGetter = false) => {
@@ -265,441 +328,457 @@ def _build_spoofer_code(fp: dict, webrtc_mode: str, timezone: str, public_ip: st
                 }); 
             } catch(e) {}
             return fn;
-        };
+        };"""
 
-        if (window.RTCPeerConnection) {
-            const OrigRPC = window.RTCPeerConnection;
+# Helper WebRTC dùng chung cho cả hai nhánh (chỉ ghép khi có nhánh WebRTC)
+_WEBRTC_COMMON_JS = r"""        // Mock onicecandidate + hook addEventListener('icecandidate'):
+        // 'disabled' chỉ cho qua event kết thúc (candidate null), 'altered' chặn hẳn listener
+        const installIceBlock = (pc, mode) => {
+            const ice = { onicecandidate: null };
+            Object.defineProperty(pc, 'onicecandidate', {
+                get: () => ice.onicecandidate,
+                set: (cb) => { ice.onicecandidate = cb; },
+                configurable: true
+            });
+            const origAddEL = pc.addEventListener;
+            pc.addEventListener = function(type, listener, options) {
+                if (type === 'icecandidate') {
+                    if (mode !== 'disabled') return;
+                    const wrapped = (e) => {
+                        if (e.candidate) return; // Chặn candidate
+                        listener(e); // Cho phép null (kết thúc)
+                    };
+                    return origAddEL.call(this, type, wrapped, options);
+                }
+                return origAddEL.call(this, type, listener, options);
+            };
+            return ice;
+        };"""
 
+# WebRTC 'disabled'
+_WEBRTC_DISABLED_JS = r"""        if (window.RTCPeerConnection) {
+            const OrigRPC = window.RTCPeerConnection;
             // =================================================================
             // CASE A: DISABLED (Dùng Native Wrapper V47 để triệt tiêu kết nối)
             // =================================================================
-            if (CONFIG.WEBRTC_MODE === 'disabled') {
-                const spoofer = function(config, ...args) {
-                    const newConfig = config || {};
-                    // Cắt server và ép relay -> không thể kết nối
-                    newConfig.iceServers = [];
-                    newConfig.iceTransportPolicy = 'relay';
-
-                    const pc = new OrigRPC(newConfig, ...args);
-
-                    // Chặn sự kiện candidate
-                    const origAddEL = pc.addEventListener;
-                    pc.addEventListener = function(type, listener, options) {
-                        if (type === 'icecandidate') {
-                            const wrapped = (e) => {
-                                if (e.candidate) return; // Chặn candidate
-                                listener(e); // Cho phép null (kết thúc)
-                            };
-                            return origAddEL.call(this, type, wrapped, options);
-                        }
-                        return origAddEL.call(this, type, listener, options);
-                    };
-                    
-                    // Hook onicecandidate
-                    let _onicecandidate = null;
-                    Object.defineProperty(pc, 'onicecandidate', {
-                        get: () => _onicecandidate,
-                        set: (cb) => { _onicecandidate = cb; },
-                        configurable: true
-                    });
-                    
-                    // Hook dispatchEvent
-                    const origDispatch = pc.dispatchEvent;
-                    pc.dispatchEvent = function(e) {
-                        if (e.type === 'icecandidate' && _onicecandidate) {
-                            if (e.candidate) return;
-                            _onicecandidate(e);
-                        }
-                        return origDispatch.call(this, e);
-                    };
+            const spoofer = function(config, ...args) {
+                const newConfig = config || {};
+                // Cắt server và ép relay -> không thể kết nối
+                newConfig.iceServers = [];
+                newConfig.iceTransportPolicy = 'relay';
 
-                    return pc;
-                };
-                spoofer.prototype = OrigRPC.prototype;
-
-                // Hook CreateOffer để xóa SDP 
-                const origCreateOffer = OrigRPC.prototype.createOffer;
-                OrigRPC.prototype.createOffer = function(options) {
-                    return origCreateOffer.call(this, options).then(offer => {
-                        if (offer && offer.sdp) {
-                            let sdp = offer.sdp;
-                            sdp = sdp.replace(/c=IN IP4 .*/g, "c=IN IP4 0.0.0.0");
-                            const lines = sdp.split('\r\n');
-                            const filtered = lines.filter(line => !line.includes('a=candidate'));
-                            offer.sdp = filtered.join('\r\n');
-                        }
-                        return offer;
-                    });
-                };
+                const pc = new OrigRPC(newConfig, ...args);
+
+                // Chặn sự kiện candidate + hook onicecandidate
+                const ice = installIceBlock(pc, 'disabled');
                 
-                Object.defineProperty(window, "RTCPeerConnection", { 
-                    value: spoofer, configurable: true, writable: true 
+                // Hook dispatchEvent
+                const origDispatch = pc.dispatchEvent;
+                pc.dispatchEvent = function(e) {
+                    if (e.type === 'icecandidate' && ice.onicecandidate) {
+                        if (e.candidate) return;
+                        ice.onicecandidate(e);
+                    }
+                    return origDispatch.call(this, e);
+                };
+
+                return pc;
+            };
+            spoofer.prototype = OrigRPC.prototype;
+
+            // Hook CreateOffer để xóa SDP 
+            const origCreateOffer = OrigRPC.prototype.createOffer;
+            OrigRPC.prototype.createOffer = function(options) {
+                return origCreateOffer.call(this, options).then(offer => {
+                    if (offer && offer.sdp) {
+                        let sdp = offer.sdp;
+                        sdp = sdp.replace(/c=IN IP4 .*/g, "c=IN IP4 0.0.0.0");
+                        // Bỏ mọi dòng a=candidate (kèm CRLF đứng trước) trong một lượt regex
+                        offer.sdp = sdp.replace(/\r\n[^\r\n]*a=candidate[^\r\n]*/g, '');
+                    }
+                    return offer;
                 });
-                protect(window.RTCPeerConnection, "RTCPeerConnection");
-            }
+            };
+            
+            Object.defineProperty(window, "RTCPeerConnection", { 
+                value: spoofer, configurable: true, writable: true 
+            });
+            protect(window.RTCPeerConnection, "RTCPeerConnection");
+        }"""
 
+# WebRTC 'altered' + có proxy (PUBLIC_IP)
+_WEBRTC_ALTERED_JS = r"""        if (window.RTCPeerConnection) {
+            const OrigRPC = window.RTCPeerConnection;
             // =================================================================
             // CASE B: ALTERED + CÓ PROXY (Logic V31.1: Native Wrapper + Inject)
             // =================================================================
-            else if (CONFIG.WEBRTC_MODE === 'altered' && CONFIG.PUBLIC_IP) {
-                // Helpers của V31.1
-                const getFakeCandidateString = (port) => {
-                    const p = port || Math.floor(Math.random() * (60000 - 10000 + 1)) + 10000;
-                    return `a=candidate:392746612 1 udp 1677729535 ${CONFIG.PUBLIC_IP} ${p} typ srflx raddr 0.0.0.0 rport 0 generation 0 network-cost 999`;
-                };
+            // Helpers của V31.1
+            // Dòng a=candidate cần bỏ: typ host, IP private (10/8, 172.16/12, 192.168/16) hoặc mDNS .local
+            // Chỉ khớp octet đầu thật sự (không dính 110.x, 1.10.x...) -> IP public không bị xóa nhầm
+            const LOCAL_CANDIDATE_RE = /\r\n(?=[^\r\n]*a=candidate)(?=[^\r\n]*(?:typ host|(?<![\d.])(?:10\.|192\.168\.|172\.(?:1[6-9]|2\d|3[01])\.)|\.local))[^\r\n]*/g;
 
-                const getFakeCandidateObj = () => {
-                    const sdp = getFakeCandidateString().replace("a=", "");
-                    return new RTCIceCandidate({ candidate: sdp, sdpMid: "0", sdpMLineIndex: 0 });
-                };
+            // Tiền tố (đã gồm PUBLIC_IP) dựng sẵn bên Python -> mỗi candidate chỉ còn nối chuỗi với port
+            const CAND_PREFIX = CONFIG.CAND_PREFIX;
+            const FAKE_C_LINE = "c=IN IP4 " + CONFIG.PUBLIC_IP;
+            const CAND_SUFFIX = " typ srflx raddr 0.0.0.0 rport 0 generation 0 network-cost 999";
+            const getFakeCandidateString = (port) => CAND_PREFIX + (port || (((Math.random() * 50001) | 0) + 10000)) + CAND_SUFFIX;
 
-                const spoofer = function(config, ...args) {
-                    const newConfig = config || {};
-                    newConfig.iceServers = []; // V31.1: Xóa server thật
-                    newConfig.iceTransportPolicy = 'relay'; // V31.1: Ép relay
-                    
-                    const pc = new OrigRPC(newConfig, ...args);
-
-                    // V31.1: Mock onicecandidate
-                    let _onicecandidate = null;
-                    Object.defineProperty(pc, 'onicecandidate', {
-                        get: () => _onicecandidate,
-                        set: (cb) => { _onicecandidate = cb; },
-                        configurable: true
-                    });
-                    
-                    // V31.1: Chặn listener icecandidate hoàn toàn
-                    const origAddEL = pc.addEventListener;
-                    pc.addEventListener = function(type, listener, options) {
-                        if (type === 'icecandidate') return; 
-                        return origAddEL.call(this, type, listener, options);
-                    };
+            // Event icecandidate dựng một lần: candidate là getter trên prototype (như event thật),
+            // không phải defineProperty lên từng instance
+            const FakeIceEvent = class RTCPeerConnectionIceEvent extends Event {
+                #cand;
+                constructor(cand) { super('icecandidate'); this.#cand = cand; }
+                get candidate() { return this.#cand; }
+            };
 
-                    // V31.1: Mock Properties & GetStats
-                    let _fakeLocalDesc = null;
-                    let _isClosed = false;
-                    const descProp = { get: () => _fakeLocalDesc || null, configurable: true };
-                    Object.defineProperties(pc, {
-                        "localDescription": descProp,
-                        "currentLocalDescription": descProp,
-                        "pendingLocalDescription": descProp,
-                        "iceConnectionState": { get: () => _isClosed ? "closed" : (_fakeLocalDesc ? "connected" : "new"), configurable: true },
-                        "iceGatheringState": { get: () => _isClosed ? "complete" : (_fakeLocalDesc ? "complete" : "new"), configurable: true },
-                        "signalingState": { get: () => _isClosed ? "closed" : (_fakeLocalDesc ? "stable" : "stable"), configurable: true }
-                    });
+            // Trạng thái giả của từng pc nằm trong WeakMap; bộ descriptor (getter đọc theo this)
+            // dựng một lần và dùng chung cho mọi RTCPeerConnection
+            const PC_STATE = new WeakMap();
+            const stateOf = (pc) => PC_STATE.get(pc) || { localDesc: null, closed: false };
+            const descProp = Object.freeze({ get: function() { return stateOf(this).localDesc || null; }, configurable: true });
+            const PC_DESCRIPTORS = Object.freeze({
+                "localDescription": descProp,
+                "currentLocalDescription": descProp,
+                "pendingLocalDescription": descProp,
+                "iceConnectionState": Object.freeze({ get: function() { const s = stateOf(this); return s.closed ? "closed" : (s.localDesc ? "connected" : "new"); }, configurable: true }),
+                "iceGatheringState": Object.freeze({ get: function() { const s = stateOf(this); return s.closed ? "complete" : (s.localDesc ? "complete" : "new"); }, configurable: true }),
+                "signalingState": Object.freeze({ get: function() { return stateOf(this).closed ? "closed" : "stable"; }, configurable: true })
+            });
 
-                    const origGetStats = pc.getStats;
-                    pc.getStats = function(selector) {
-                        return new Promise((resolve, reject) => {
-                            if (_fakeLocalDesc) {
-                                const stats = new Map();
-                                const ts = Date.now();
-                                stats.set("candidate-pair", {
-                                    id: "candidate-pair", timestamp: ts, type: "candidate-pair",
-                                    state: "succeeded", writable: true, nominated: true,
-                                    priority: 1677729535
-                                });
-                                resolve(stats);
-                            } else {
-                                origGetStats.apply(this, arguments).then(resolve).catch(reject);
-                            }
-                        });
-                    };
+            const getFakeCandidateObj = () => {
+                const sdp = getFakeCandidateString().replace("a=", "");
+                return new RTCIceCandidate({ candidate: sdp, sdpMid: "0", sdpMLineIndex: 0 });
+            };
 
-                    // V31.1: Fire Fake Events
-                    const fire = (name) => {
-                        if (_isClosed) return;
-                        try {
-                            const e = new Event(name);
-                            pc.dispatchEvent(e);
-                            if (typeof pc['on' + name] === 'function') pc['on' + name](e);
-                        } catch(err) {}
-                    };
+            const spoofer = function(config, ...args) {
+                const newConfig = config || {};
+                newConfig.iceServers = []; // V31.1: Xóa server thật
+                newConfig.iceTransportPolicy = 'relay'; // V31.1: Ép relay
+                
+                const pc = new OrigRPC(newConfig, ...args);
 
-                    const origSetLocal = pc.setLocalDescription;
-                    pc.setLocalDescription = function(desc) {
-                        _fakeLocalDesc = desc;
-                        
-                        Promise.resolve().then(() => {
-                            fire('signalingstatechange');
-                            fire('icegatheringstatechange');
-                            
-                            // BẮN DUY NHẤT CANDIDATE FAKE
-                            const candObj = getFakeCandidateObj();
-                            if (candObj) {
-                                try {
-                                    const e = new Event('icecandidate');
-                                    Object.defineProperty(e, 'candidate', { value: candObj, writable: false });
-                                    pc.dispatchEvent(e);
-                                    if (typeof _onicecandidate === 'function') _onicecandidate(e);
-                                } catch(e){}
-                            }
-                        });
+                // V31.1: Mock onicecandidate + chặn listener icecandidate hoàn toàn
+                const ice = installIceBlock(pc, 'altered');
 
-                        setTimeout(() => {
-                            fire('icegatheringstatechange');
-                            fire('iceconnectionstatechange');
-                        }, 50);
+                // V31.1: Mock Properties & GetStats
+                const st = { localDesc: null, closed: false };
+                PC_STATE.set(pc, st);
+                Object.defineProperties(pc, PC_DESCRIPTORS);
 
-                        return origSetLocal.call(this, desc).catch(e => Promise.resolve()); 
-                    };
-                    const origClose = pc.close;
-                    pc.close = function() { _isClosed = true; return origClose.apply(this, arguments); };
-                    return pc;
-                };
-                spoofer.prototype = OrigRPC.prototype;
-
-                // V31.1: Create Offer Hook (Regex Injection)
-                const origCreateOffer = OrigRPC.prototype.createOffer;
-                OrigRPC.prototype.createOffer = function(options) {
-                    return origCreateOffer.call(this, options).then(offer => {
-                        if (offer && offer.sdp) {
-                            let sdp = offer.sdp;
-                            // 1. Fake Connection Line
-                            const fakeCLine = `c=IN IP4 ${CONFIG.PUBLIC_IP}`;
-                            sdp = sdp.replace(/c=IN IP4 0\.0\.0\.0/g, fakeCLine);
-                            
-                            // 2. Inject Fake Candidate via Regex
-                            const regex = /(a=mid:(\w+))/g;
-                            sdp = sdp.replace(regex, (match, p1, midVal) => {
-                                const port = Math.floor(Math.random() * (60000 - 10000 + 1)) + 10000;
-                                const candStr = getFakeCandidateString(port);
-                                return `${p1}\r\n${candStr}`;
+                const origGetStats = pc.getStats;
+                pc.getStats = function(selector) {
+                    return new Promise((resolve, reject) => {
+                        if (st.localDesc) {
+                            const stats = new Map();
+                            const ts = Date.now();
+                            stats.set("candidate-pair", {
+                                id: "candidate-pair", timestamp: ts, type: "candidate-pair",
+                                state: "succeeded", writable: true, nominated: true,
+                                priority: 1677729535
                             });
-                            
-                            // 3. Xóa sạch IP nội bộ
-                            const lines = sdp.split('\r\n');
-                            const filtered = lines.filter(line => {
-                                if (line.includes('a=candidate')) {
-                                    if (line.includes('typ host')) return false; 
-                                    if (line.includes('192.168.') || line.includes('10.') || line.includes('172.') || line.includes('.local')) return false;
-                                }
-                                return true;
-                            });
-                            offer.sdp = filtered.join('\r\n');
+                            resolve(stats);
+                        } else {
+                            origGetStats.apply(this, arguments).then(resolve).catch(reject);
                         }
-                        return offer;
                     });
                 };
-                
-                Object.defineProperty(window, "RTCPeerConnection", { 
-                    value: spoofer, configurable: true, writable: true 
+
+                // V31.1: Fire Fake Events
+                const fire = (name) => {
+                    if (st.closed) return;
+                    try {
+                        const e = new Event(name);
+                        pc.dispatchEvent(e);
+                        if (typeof pc['on' + name] === 'function') pc['on' + name](e);
+                    } catch(err) {}
+                };
+
+                const origSetLocal = pc.setLocalDescription;
+                pc.setLocalDescription = function(desc) {
+                    st.localDesc = desc;
+                    
+                    Promise.resolve().then(() => {
+                        fire('signalingstatechange');
+                        fire('icegatheringstatechange');
+                        
+                        // BẮN DUY NHẤT CANDIDATE FAKE
+                        const candObj = getFakeCandidateObj();
+                        if (candObj) {
+                            try {
+                                const e = new FakeIceEvent(candObj);
+                                pc.dispatchEvent(e);
+                                if (typeof ice.onicecandidate === 'function') ice.onicecandidate(e);
+                            } catch(e){}
+                        }
+                    });
+
+                    setTimeout(() => {
+                        fire('icegatheringstatechange');
+                        fire('iceconnectionstatechange');
+                    }, 50);
+
+                    return origSetLocal.call(this, desc).catch(e => Promise.resolve()); 
+                };
+                const origClose = pc.close;
+                pc.close = function() { st.closed = true; return origClose.apply(this, arguments); };
+                return pc;
+            };
+            spoofer.prototype = OrigRPC.prototype;
+
+            // V31.1: Create Offer Hook (Regex Injection)
+            const origCreateOffer = OrigRPC.prototype.createOffer;
+            OrigRPC.prototype.createOffer = function(options) {
+                return origCreateOffer.call(this, options).then(offer => {
+                    if (offer && offer.sdp) {
+                        let sdp = offer.sdp;
+                        // 1. Fake Connection Line
+                        sdp = sdp.replace(/c=IN IP4 0\.0\.0\.0/g, FAKE_C_LINE);
+                        
+                        // 2. Inject Fake Candidate via Regex
+                        // Một port srflx cho cả offer (client thật dùng chung candidate cho các mid đã bundle)
+                        const port = ((Math.random() * 50001) | 0) + 10000;
+                        const candLine = "\r\n" + getFakeCandidateString(port);
+                        const regex = /(a=mid:(\w+))/g;
+                        sdp = sdp.replace(regex, (match, p1) => p1 + candLine);
+                        
+                        // 3. Xóa sạch IP nội bộ: một lượt regex, bỏ dòng a=candidate (kèm CRLF đứng trước)
+                        // nếu là typ host hoặc chứa IP LAN / .local -> không tạo mảng trung gian
+                        offer.sdp = sdp.replace(LOCAL_CANDIDATE_RE, '');
+                    }
+                    return offer;
                 });
-                protect(window.RTCPeerConnection, "RTCPeerConnection");
-            }
+            };
+            
+            Object.defineProperty(window, "RTCPeerConnection", { 
+                value: spoofer, configurable: true, writable: true 
+            });
+            protect(window.RTCPeerConnection, "RTCPeerConnection");
+        }"""
 
-            // =================================================================
-            // CASE C: ALTERED + NO PROXY
-            // (Không làm gì cả -> Giống trình duyệt thường -> Đúng yêu cầu)
-            // =================================================================
-        }
-        
-        // =================================================================
+# Navigator & Client Hints
+_NAV_JS = r"""        // =================================================================
         // NAVIGATOR & CLIENT HINTS (FIX PHáº M VI BIáº¾N & PROTOTYPE)
         // =================================================================
-        if (CONFIG.NAV) {
-            try {
-                // 1. Setup dá»¯ liá»‡u Fake
-                const uaVersion = CONFIG.NAV.uaVersion || "120";
-                const fullVersion = uaVersion + ".0.0.0"; 
-                const platform = CONFIG.NAV.platform || "Win32";
-                
-                // FIX 1: Brands pháº£i match chÃ­nh xÃ¡c vá»›i Chrome hiá»‡n táº¡i
-                const brands = [
-                    {brand: "Not A(Brand", version: "8"},  // LÆ°u Ã½: dáº¥u ( thay vÃ¬ _
-                    {brand: "Chromium", version: uaVersion},
-                    {brand: "Google Chrome", version: uaVersion}
-                ];
-        
-                // 2. Override thuá»™c tÃ­nh cÆ¡ báº£n
-                const override = (prop, val) => {
-                    if (prop in navigator) {
-                        Object.defineProperty(navigator, prop, { 
-                            get: protect(() => val, prop, true),
-                            configurable: true,
-                            enumerable: true
-                        });
-                    }
-                };
-                
-                if (CONFIG.NAV.userAgent) override('userAgent', CONFIG.NAV.userAgent);
-                if (CONFIG.NAV.appVersion) override('appVersion', CONFIG.NAV.appVersion);
-                if (CONFIG.NAV.platform) override('platform', platform);
-                if (CONFIG.NAV.hardwareConcurrency) override('hardwareConcurrency', CONFIG.NAV.hardwareConcurrency);
-                if (CONFIG.NAV.deviceMemory) override('deviceMemory', CONFIG.NAV.deviceMemory);
-                
-                override('webdriver', false);
-                override('maxTouchPoints', 0);
-                override('vendor', 'Google Inc.');
-                override('language', 'en-US');
-                override('languages', ['en-US', 'en']);
-                override('onLine', true);
-                override('cookieEnabled', true);
-                override('doNotTrack', null);
-                override('pdfViewerEnabled', true);
-                
-                // FIX 2: Plugins vÃ  MimeTypes
-                Object.defineProperty(navigator, 'plugins', {
-                    get: protect(() => ({
-                        length: 5,
-                        item: (i) => null,
-                        namedItem: (n) => null,
-                        refresh: () => {},
-                        [Symbol.iterator]: function* () {}
-                    }), 'plugins', true),
-                    configurable: true,
-                    enumerable: true
+        try {
+            // 1. Setup dá»¯ liá»‡u Fake
+            const uaVersion = CONFIG.NAV.uaVersion || "120";
+            const fullVersion = uaVersion + ".0.0.0"; 
+            const platform = CONFIG.NAV.platform || "Win32";
+            
+            // FIX 1: Brands pháº£i match chÃ­nh xÃ¡c vá»›i Chrome hiá»‡n táº¡i
+            const brands = Object.freeze([
+                Object.freeze({brand: "Not A(Brand", version: "8"}),  // LÆ°u Ã½: dáº¥u ( thay vÃ¬ _
+                Object.freeze({brand: "Chromium", version: uaVersion}),
+                Object.freeze({brand: "Google Chrome", version: uaVersion})
+            ]);
+    
+            // 2. Override thuá»™c tÃ­nh cÆ¡ báº£n
+            // Gom descriptor rồi cài một lần bằng defineProperties (một lần đổi shape cho navigator)
+            const navDescs = {};
+            const override = (prop, val) => {
+                if (prop in navigator) {
+                    navDescs[prop] = { 
+                        get: protect(() => val, prop, true),
+                        configurable: true,
+                        enumerable: true
+                    };
+                }
+            };
+            
+            if (CONFIG.NAV.userAgent) override('userAgent', CONFIG.NAV.userAgent);
+            if (CONFIG.NAV.appVersion) override('appVersion', CONFIG.NAV.appVersion);
+            if (CONFIG.NAV.platform) override('platform', platform);
+            if (CONFIG.NAV.hardwareConcurrency) override('hardwareConcurrency', CONFIG.NAV.hardwareConcurrency);
+            if (CONFIG.NAV.deviceMemory) override('deviceMemory', CONFIG.NAV.deviceMemory);
+            
+            override('webdriver', false);
+            override('maxTouchPoints', 0);
+            override('vendor', 'Google Inc.');
+            override('language', 'en-US');
+            override('languages', ['en-US', 'en']);
+            override('onLine', true);
+            override('cookieEnabled', true);
+            override('doNotTrack', null);
+            override('pdfViewerEnabled', true);
+            Object.defineProperties(navigator, navDescs);
+            
+            // FIX 2: Plugins vÃ  MimeTypes
+            Object.defineProperty(navigator, 'plugins', {
+                get: protect(() => ({
+                    length: 5,
+                    item: (i) => null,
+                    namedItem: (n) => null,
+                    refresh: () => {},
+                    [Symbol.iterator]: function* () {}
+                }), 'plugins', true),
+                configurable: true,
+                enumerable: true
+            });
+            
+            Object.defineProperty(navigator, 'mimeTypes', {
+                get: protect(() => ({
+                    length: 4,
+                    item: (i) => null,
+                    namedItem: (n) => null,
+                    [Symbol.iterator]: function* () {}
+                }), 'mimeTypes', true),
+                configurable: true,
+                enumerable: true
+            });
+    
+            // FIX 3: Client Hints - QUAN TRá»ŒNG NHáº¤T
+            if (Navigator.prototype) {
+                const platformVersion = platform === "Win32" ? "10.0.0" : "15.0.0";
+                const architecture = "x86";
+                const bitness = "64";
+                const model = "";
+                const mobile = false;
+
+                // Giá trị high-entropy dựng sẵn một lần; mỗi lần gọi chỉ chép tham chiếu theo hints
+                const fullVersionList = Object.freeze([
+                    Object.freeze({brand: "Not A(Brand", version: "8.0.0.0"}),
+                    Object.freeze({brand: "Chromium", version: fullVersion}),
+                    Object.freeze({brand: "Google Chrome", version: fullVersion})
+                ]);
+                const HINT_VALUES = Object.freeze({
+                    platformVersion: platformVersion,
+                    architecture: architecture,
+                    bitness: bitness,
+                    model: model,
+                    uaFullVersion: fullVersion,
+                    fullVersionList: fullVersionList
                 });
+                const HINT_KEYS = Object.freeze(Object.keys(HINT_VALUES));
                 
-                Object.defineProperty(navigator, 'mimeTypes', {
-                    get: protect(() => ({
-                        length: 4,
-                        item: (i) => null,
-                        namedItem: (n) => null,
-                        [Symbol.iterator]: function* () {}
-                    }), 'mimeTypes', true),
-                    configurable: true,
-                    enumerable: true
-                });
-        
-                // FIX 3: Client Hints - QUAN TRá»ŒNG NHáº¤T
-                if (Navigator.prototype) {
-                    const platformVersion = platform === "Win32" ? "10.0.0" : "15.0.0";
-                    const architecture = "x86";
-                    const bitness = "64";
-                    const model = "";
-                    const mobile = false;
-                    
-                    const uaDataGetter = function() {
-                        return {
-                            brands: brands,
-                            mobile: mobile,
-                            platform: platform,
-                            
-                            // FIX: getHighEntropyValues pháº£i trung thá»±c vá»›i spec
-                            getHighEntropyValues: protect(function(hints) {
-                                return Promise.resolve().then(() => {
-                                    const result = {
-                                        brands: brands,
-                                        mobile: mobile,
-                                        platform: platform
-                                    };
-                                    
-                                    // Cung cáº¥p Ä'áº§y Ä'á»§ hints nháº­n Ä'Æ°á»£c
-                                    const hintsArray = Array.isArray(hints) ? hints : [];
-                                    
-                                    if (hintsArray.includes("platformVersion")) {
-                                        result.platformVersion = platformVersion;
-                                    }
-                                    if (hintsArray.includes("architecture")) {
-                                        result.architecture = architecture;
-                                    }
-                                    if (hintsArray.includes("bitness")) {
-                                        result.bitness = bitness;
-                                    }
-                                    if (hintsArray.includes("model")) {
-                                        result.model = model;
-                                    }
-                                    if (hintsArray.includes("uaFullVersion")) {
-                                        result.uaFullVersion = fullVersion;
-                                    }
-                                    if (hintsArray.includes("fullVersionList")) {
-                                        result.fullVersionList = [
-                                            {brand: "Not A(Brand", version: "8.0.0.0"},
-                                            {brand: "Chromium", version: fullVersion},
-                                            {brand: "Google Chrome", version: fullVersion}
-                                        ];
-                                    }
-                                    
-                                    return result;
-                                });
-                            }, "getHighEntropyValues"),
-                            
-                            // FIX: ThÃªm toJSON Ä'á»ƒ serialize Ä'Ãºng
-                            toJSON: protect(function() {
-                                return {
+                const uaDataGetter = function() {
+                    return {
+                        brands: brands,
+                        mobile: mobile,
+                        platform: platform,
+                        
+                        // FIX: getHighEntropyValues pháº£i trung thá»±c vá»›i spec
+                        getHighEntropyValues: protect(function(hints) {
+                            return Promise.resolve().then(() => {
+                                const result = {
                                     brands: brands,
                                     mobile: mobile,
                                     platform: platform
                                 };
-                            }, "toJSON")
-                        };
+                                
+                                // Cung cáº¥p Ä'áº§y Ä'á»§ hints nháº­n Ä'Æ°á»£c
+                                const hintsArray = Array.isArray(hints) ? hints : [];
+                                
+                                // Giữ thứ tự key cố định như trước, không phụ thuộc thứ tự hints
+                                for (const key of HINT_KEYS) {
+                                    if (hintsArray.includes(key)) result[key] = HINT_VALUES[key];
+                                }
+                                
+                                return result;
+                            });
+                        }, "getHighEntropyValues"),
+                        
+                        // FIX: ThÃªm toJSON Ä'á»ƒ serialize Ä'Ãºng
+                        toJSON: protect(function() {
+                            return {
+                                brands: brands,
+                                mobile: mobile,
+                                platform: platform
+                            };
+                        }, "toJSON")
                     };
-                    
-                    Object.defineProperty(Navigator.prototype, 'userAgentData', {
-                        get: protect(uaDataGetter, 'userAgentData', true),
-                        configurable: true,
-                        enumerable: true
-                    });
-                }
+                };
                 
-            } catch(e) { console.error("Nav Spoof Error", e); }
-        }
+                Object.defineProperty(Navigator.prototype, 'userAgentData', {
+                    get: protect(uaDataGetter, 'userAgentData', true),
+                    configurable: true,
+                    enumerable: true
+                });
+            }
+            
+        } catch(e) { console.error("Nav Spoof Error", e); }"""
 
-        // ==========================================
+# Timezone
+_TZ_JS = r"""        // ==========================================
         // CÁC SPOOFER PHỤ (GIỮ NGUYÊN V47)
         // ==========================================
-        if (CONFIG.TZ) {
-            const OriginalDTF = Intl.DateTimeFormat;
-            const _origToLocaleString = Date.prototype.toLocaleString;
-            const ProxiedDTF = function(locales, options) {
-                const opts = options ? Object.assign({}, options) : {};
-                opts.timeZone = CONFIG.TZ;
-                return new OriginalDTF(locales, opts);
-            };
-            ProxiedDTF.prototype = OriginalDTF.prototype;
-            ProxiedDTF.supportedLocalesOf = OriginalDTF.supportedLocalesOf;
-            protect(ProxiedDTF, "DateTimeFormat");
-            Intl.DateTimeFormat = ProxiedDTF;
-            const origResolved = OriginalDTF.prototype.resolvedOptions;
-            OriginalDTF.prototype.resolvedOptions = function() {
-                const o = origResolved.call(this);
-                o.timeZone = CONFIG.TZ;
-                return o;
-            };
-            const getSpoofedString = function() {
-                try {
-                    const dtf = new OriginalDTF("en-US", {
+        const OriginalDTF = Intl.DateTimeFormat;
+        const _origToLocaleString = Date.prototype.toLocaleString;
+        const ProxiedDTF = function(locales, options) {
+            const opts = options ? Object.assign({}, options) : {};
+            opts.timeZone = CONFIG.TZ;
+            return new OriginalDTF(locales, opts);
+        };
+        ProxiedDTF.prototype = OriginalDTF.prototype;
+        ProxiedDTF.supportedLocalesOf = OriginalDTF.supportedLocalesOf;
+        protect(ProxiedDTF, "DateTimeFormat");
+        Intl.DateTimeFormat = ProxiedDTF;
+        const origResolved = OriginalDTF.prototype.resolvedOptions;
+        OriginalDTF.prototype.resolvedOptions = function() {
+            const o = origResolved.call(this);
+            o.timeZone = CONFIG.TZ;
+            return o;
+        };
+        // 3 formatter dựng một lần (TZ cố định cho cả script), toString() chỉ còn formatToParts
+        let _dtfMain = null, _dtfOff = null, _dtfLong = null;
+        const getSpoofedString = function() {
+            try {
+                if (!_dtfMain) {
+                    _dtfMain = new OriginalDTF("en-US", {
                         timeZone: CONFIG.TZ,
                         weekday: "short", month: "short", day: "2-digit", year: "numeric",
                         hour: "2-digit", minute: "2-digit", second: "2-digit",
                         hour12: false, timeZoneName: "short"
                     });
-                    const p = dtf.formatToParts(this).reduce((a, v) => { a[v.type] = v.value; return a; }, {});
-                    const dtfOff = new OriginalDTF("en-US", { timeZone: CONFIG.TZ, timeZoneName: "longOffset" });
-                    const offPart = dtfOff.formatToParts(this).find(x => x.type === "timeZoneName");
-                    const gmt = "GMT" + (offPart ? offPart.value.replace("GMT", "").replace(":", "") : "+0000");
-                    const dtfLong = new OriginalDTF("en-US", { timeZone: CONFIG.TZ, timeZoneName: "long" });
-                    const tzName = dtfLong.formatToParts(this).find(x => x.type === "timeZoneName")?.value || CONFIG.TZ;
-                    return `${p.weekday} ${p.month} ${p.day} ${p.year} ${p.hour}:${p.minute}:${p.second} ${gmt} (${tzName})`;
-                } catch(e) { return this.toUTCString(); }
-            };
-            Date.prototype.toString = getSpoofedString;
-            protect(Date.prototype.toString, "toString");
-            Date.prototype.toLocaleString = function(locales, options) {
-                const opts = options ? Object.assign({}, options) : {};
-                opts.timeZone = CONFIG.TZ; 
-                return _origToLocaleString.call(this, locales, opts);
-            };
-            protect(Date.prototype.toLocaleString, "toLocaleString");
-        }
+                    _dtfOff = new OriginalDTF("en-US", { timeZone: CONFIG.TZ, timeZoneName: "longOffset" });
+                    _dtfLong = new OriginalDTF("en-US", { timeZone: CONFIG.TZ, timeZoneName: "long" });
+                }
+                const parts = _dtfMain.formatToParts(this);
+                const p = Object.create(null);
+                for (let i = 0; i < parts.length; i++) p[parts[i].type] = parts[i].value;
+                const offPart = _dtfOff.formatToParts(this).find(x => x.type === "timeZoneName");
+                const gmt = "GMT" + (offPart ? offPart.value.replace("GMT", "").replace(":", "") : "+0000");
+                const tzName = _dtfLong.formatToParts(this).find(x => x.type === "timeZoneName")?.value || CONFIG.TZ;
+                return `${p.weekday} ${p.month} ${p.day} ${p.year} ${p.hour}:${p.minute}:${p.second} ${gmt} (${tzName})`;
+            } catch(e) { return this.toUTCString(); }
+        };
+        Date.prototype.toString = getSpoofedString;
+        protect(Date.prototype.toString, "toString");
+        Date.prototype.toLocaleString = function(locales, options) {
+            const opts = options ? Object.assign({}, options) : {};
+            opts.timeZone = CONFIG.TZ; 
+            return _origToLocaleString.call(this, locales, opts);
+        };
+        protect(Date.prototype.toLocaleString, "toLocaleString");"""
 
-        // =================================================================
+# Canvas (luôn bật)
+_CANVAS_JS = r"""        // =================================================================
         // CANVAS FIX: BLOCK AT EXIT (OFFSET STRATEGY)
         // =================================================================
         try {
             const salt = CONFIG.CANVAS.salt || 333;
             const origToDataURL = HTMLCanvasElement.prototype.toDataURL;
+            // Không dùng OffscreenCanvas: nó không có toDataURL đồng bộ, mà kết quả phải đúng kích thước canvas gốc
+            let _shadow = null;
+            let _shadowCtx = null;
             
             HTMLCanvasElement.prototype.toDataURL = function(type, quality) {
                 // 1. Chỉ can thiệp các canvas có nội dung (>16px)
                 // Điều này tránh ảnh hưởng các icon hoặc canvas kỹ thuật nhỏ
                 if (this.width > 16 && this.height > 16) {
                     try {
-                        const shadow = document.createElement('canvas');
-                        shadow.width = this.width;
-                        shadow.height = this.height;
-                        const ctx = shadow.getContext("2d");
+                        // Dùng lại một shadow canvas; chỉ đổi kích thước khi khác canvas nguồn
+                        if (!_shadow) {
+                            _shadow = document.createElement('canvas');
+                            _shadowCtx = null;
+                        }
+                        const shadow = _shadow;
+                        if (shadow.width !== this.width || shadow.height !== this.height) {
+                            shadow.width = this.width;
+                            shadow.height = this.height;
+                        } else if (_shadowCtx) {
+                            _shadowCtx.clearRect(0, 0, shadow.width, shadow.height);
+                        }
+                        const ctx = _shadowCtx || (_shadowCtx = shadow.getContext("2d"));
                         
                         // 2. KỸ THUẬT: DỊCH CHUYỂN KHUNG HÌNH (FRAME SHIFT)
                         // Thay vì vẽ tại (0,0), ta vẽ lệch đi một khoảng siêu nhỏ (0.01px - 0.1px)
@@ -725,165 +804,288 @@ def _build_spoofer_code(fp: dict, webrtc_mode: str, timezone: str, public_ip: st
             };
             protect(HTMLCanvasElement.prototype.toDataURL, "toDataURL");
             
+            const LITTLE_ENDIAN = new Uint8Array(new Uint32Array([1]).buffer)[0] === 1;
             const origGetImageData = CanvasRenderingContext2D.prototype.getImageData;
                 CanvasRenderingContext2D.prototype.getImageData = function(x, y, w, h) {
                     const data = origGetImageData.call(this, x, y, w, h);
                     if (w > 16 && h > 16) { 
                          // Làm nhiễu nhẹ mảng pixel để đổi Hash
+                         // Duyệt qua view Uint32 trên cùng buffer: byte 40*k <-> word 10*k,
+                         // XOR đúng byte thấp (kênh R) nên kết quả y hệt bản duyệt từng byte
                          const s = (CONFIG.CANVAS.salt || 333) % 7;
-                         for (let i = 0; i < data.data.length; i += 40) {
-                             data.data[i] = data.data[i] ^ s;
+                         const px = data.data;
+                         const buf32 = new Uint32Array(px.buffer, px.byteOffset, px.length >>> 2);
+                         const s32 = LITTLE_ENDIAN ? s : (s << 24);
+                         for (let i = 0; i < buf32.length; i += 10) {
+                             buf32[i] ^= s32;
                          }
                     }
                     return data;
                 };
                 protect(CanvasRenderingContext2D.prototype.getImageData, "getImageData");
 
-        } catch(e) { console.error("Canvas Patch Error", e); }
+        } catch(e) { console.error("Canvas Patch Error", e); }"""
 
-        // =================================================================
+# WebGL
+_WEBGL_JS = r"""        // =================================================================
         // FIX PATCH 2.1: WEBGL SPOOFING (SAFE MODE)
         // Sửa lỗi BrowserLeaks trống & Pixelscan treo
         // =================================================================
-        if (CONFIG.WEBGL) {
-            try {
-                // Helper để hook an toàn, không crash nếu web gọi sai context
-                const safeOverride = (proto) => {
-                    const origGetParameter = proto.getParameter;
+        try {
+            // Helper để hook an toàn, không crash nếu web gọi sai context
+            const safeOverride = (proto) => {
+                const origGetParameter = proto.getParameter;
+                
+                // Ghi đè bằng Proxy hoặc Wrap function để giữ 'this' context chuẩn
+                proto.getParameter = function(parameter) {
+                    // 37445: UNMASKED_VENDOR_WEBGL
+                    // 37446: UNMASKED_RENDERER_WEBGL
+                    if (parameter === 37445) return CONFIG.WEBGL.vendor;
+                    if (parameter === 37446) return CONFIG.WEBGL.renderer;
                     
-                    // Ghi đè bằng Proxy hoặc Wrap function để giữ 'this' context chuẩn
-                    proto.getParameter = function(parameter) {
-                        // 37445: UNMASKED_VENDOR_WEBGL
-                        // 37446: UNMASKED_RENDERER_WEBGL
-                        if (parameter === 37445) return CONFIG.WEBGL.vendor;
-                        if (parameter === 37446) return CONFIG.WEBGL.renderer;
-                        
-                        try {
-                            return origGetParameter.apply(this, arguments);
-                        } catch(e) {
-                            // Nếu lỗi, thử gọi trực tiếp (fallback) để tránh crash trang web
-                            return null;
-                        }
-                    };
-                    protect(proto.getParameter, "getParameter");
+                    try {
+                        return origGetParameter.apply(this, arguments);
+                    } catch(e) {
+                        // Nếu lỗi, thử gọi trực tiếp (fallback) để tránh crash trang web
+                        return null;
+                    }
                 };
+                protect(proto.getParameter, "getParameter");
+            };
 
-                // Hook WebGL 1
-                if (window.WebGLRenderingContext) {
-                    safeOverride(window.WebGLRenderingContext.prototype);
-                }
+            // Hook WebGL 1
+            if (window.WebGLRenderingContext) {
+                safeOverride(window.WebGLRenderingContext.prototype);
+            }
 
-                // Hook WebGL 2 (Quan trọng cho browser đời mới)
-                if (window.WebGL2RenderingContext) {
-                    safeOverride(window.WebGL2RenderingContext.prototype);
-                }
-                
-                // [FIX] Tăng entropy cho WebGL (Tránh trùng lặp 100%)
-                const spoofReadPixels = (proto) => {
-                    const origRead = proto.readPixels;
-                    proto.readPixels = function(x, y, width, height, format, type, pixels) {
-                        const res = origRead.apply(this, arguments);
-                        try {
-                            if (pixels && pixels.length > 0) {
-                                const salt = CONFIG.CANVAS.salt || 9999;
-                                // Dùng toàn bộ giá trị salt để tính noise (biên độ rộng hơn)
-                                // Thay vì chỉ có 7 biến thể, giờ sẽ có 255 biến thể
-                                const noise = (salt % 255) + 1; 
-                                
-                                pixels[0] = pixels[0] ^ noise;
-                                // Tăng mật độ nhiễu
-                                for (let i = 20; i < pixels.length; i += 37) {
-                                     pixels[i] = pixels[i] ^ noise;
-                                }
+            // Hook WebGL 2 (Quan trọng cho browser đời mới)
+            if (window.WebGL2RenderingContext) {
+                safeOverride(window.WebGL2RenderingContext.prototype);
+            }
+            
+            // [FIX] Tăng entropy cho WebGL (Tránh trùng lặp 100%)
+            const spoofReadPixels = (proto) => {
+                const origRead = proto.readPixels;
+                proto.readPixels = function(x, y, width, height, format, type, pixels) {
+                    const res = origRead.apply(this, arguments);
+                    try {
+                        if (pixels && pixels.length > 0) {
+                            const salt = CONFIG.CANVAS.salt || 9999;
+                            // Dùng toàn bộ giá trị salt để tính noise (biên độ rộng hơn)
+                            // Thay vì chỉ có 7 biến thể, giờ sẽ có 255 biến thể
+                            const noise = (salt % 255) + 1; 
+                            
+                            pixels[0] = pixels[0] ^ noise;
+                            // Tăng mật độ nhiễu
+                            for (let i = 20; i < pixels.length; i += 37) {
+                                 pixels[i] = pixels[i] ^ noise;
                             }
-                        } catch(e) {}
-                        return res;
-                    };
-                    protect(proto.readPixels, "readPixels");
+                        }
+                    } catch(e) {}
+                    return res;
                 };
-                
-                // Áp dụng cho cả WebGL 1 và 2
-                if (window.WebGLRenderingContext) spoofReadPixels(window.WebGLRenderingContext.prototype);
-                if (window.WebGL2RenderingContext) spoofReadPixels(window.WebGL2RenderingContext.prototype);
+                protect(proto.readPixels, "readPixels");
+            };
             
-            } catch(e) { console.error("WebGL Spoof Error", e); }
-        }
+            // Áp dụng cho cả WebGL 1 và 2
+            if (window.WebGLRenderingContext) spoofReadPixels(window.WebGLRenderingContext.prototype);
+            if (window.WebGL2RenderingContext) spoofReadPixels(window.WebGL2RenderingContext.prototype);
         
-        // =================================================================
+        } catch(e) { console.error("WebGL Spoof Error", e); }"""
+
+# Audio
+_AUDIO_JS = r"""        // =================================================================
         // AUDIO FIX: BUFFER DATA HOOK (LOW LEVEL)
         // =================================================================
-        if (CONFIG.AUDIO) {
-            try {
-                // Hook trực tiếp vào nơi chứa dữ liệu âm thanh
-                // Bất kể OfflineAudioContext hay AudioContext đều phải qua đây
-                if (window.AudioBuffer && window.AudioBuffer.prototype) {
-                    const origGetChannelData = window.AudioBuffer.prototype.getChannelData;
+        try {
+            // Hook trực tiếp vào nơi chứa dữ liệu âm thanh
+            // Bất kể OfflineAudioContext hay AudioContext đều phải qua đây
+            if (window.AudioBuffer && window.AudioBuffer.prototype) {
+                const origGetChannelData = window.AudioBuffer.prototype.getChannelData;
+
+                // Seeded Random đơn giản để đảm bảo tính nhất quán (Iphey Xanh)
+                // Salt cố định theo profile -> dãy nhiễu tính sẵn, hook chỉ việc cộng.
+                // Giữ nguyên công thức LCG cũ và Float64 để giá trị nhiễu (audio fingerprint
+                // của profile) không đổi; bảng chỉ nới thêm khi gặp buffer dài hơn
+                let seed = CONFIG.CANVAS.salt || 12345;
+                const random = () => {
+                    seed = (seed * 9301 + 49297) % 233280;
+                    return seed / 233280;
+                };
+                let NOISE = new Float64Array(0);
+                const ensureNoise = (count) => {
+                    if (count <= NOISE.length) return;
+                    const t = new Float64Array(Math.max(count, NOISE.length * 2, 1024));
+                    t.set(NOISE);
+                    // Rải nhiễu biên độ lớn hơn (1e-4)
+                    for (let j = NOISE.length; j < t.length; j++) t[j] = (random() * 0.0002) - 0.0001;
+                    NOISE = t;
+                };
+                ensureNoise(1024);
+                // Mảng đã làm nhiễu: giữ trong WeakSet thay vì gắn thuộc tính lên Float32Array
+                const SPOOFED = new WeakSet();
+                
+                window.AudioBuffer.prototype.getChannelData = function(channel) {
+                    const data = origGetChannelData.call(this, channel);
                     
-                    window.AudioBuffer.prototype.getChannelData = function(channel) {
-                        const data = origGetChannelData.call(this, channel);
-                        
-                        // Nếu data đã bị làm nhiễu (đánh dấu) thì bỏ qua để tránh cộng dồn
-                        if (data._spoofed) return data;
-                        
-                        // Seeded Random đơn giản để đảm bảo tính nhất quán (Iphey Xanh)
-                        let seed = CONFIG.CANVAS.salt || 12345;
-                        const random = () => {
-                            seed = (seed * 9301 + 49297) % 233280;
-                            return seed / 233280;
-                        };
-
-                        // Rải nhiễu biên độ lớn hơn (1e-4)
-                        for (let i = 0; i < data.length; i += 50) {
-                            const noise = (random() * 0.0002) - 0.0001;
-                            data[i] += noise;
-                        }
-                        
-                        // Đánh dấu đã xử lý
-                        Object.defineProperty(data, '_spoofed', { value: true, enumerable: false });
-                        
-                        return data;
-                    };
-                    protect(window.AudioBuffer.prototype.getChannelData, "getChannelData");
-                }
-            } catch(e) { console.error("Audio Patch Error", e); }
-        }
+                    // Nếu data đã bị làm nhiễu (đánh dấu) thì bỏ qua để tránh cộng dồn
+                    if (SPOOFED.has(data)) return data;
 
-        // --- RECTS PATCH (SCALING) ---
-        if (CONFIG.RECTS) {
-             try {
-                 // Dùng tỷ lệ scale thay vì cộng số cố định
-                 // CONFIG.RECTS từ Python (0.2 - 1.2) * hệ số nhỏ
-                 const rectScale = 1.0 + (CONFIG.RECTS * 0.00001); 
-                 
-                 const spoofRect = (r) => {
-                     if (!r) return r;
-                     return {
-                         x: r.x, y: r.y, top: r.top, bottom: r.bottom, left: r.left, right: r.right,
-                         width: r.width * rectScale, 
-                         height: r.height * rectScale,
-                         toJSON: function() { return this; }
-                     };
-                 };
+                    // Trải 4 lần mỗi vòng; bảng đủ ceil(n / 50) phần tử nên không cần quay vòng
+                    const n = data.length | 0;
+                    ensureNoise(((n + 49) / 50) | 0);
+                    const N = NOISE;
+                    const lim = n - 150;
+                    let i = 0, j = 0;
+                    for (; i < lim; i += 200, j += 4) {
+                        data[i] += N[j];
+                        data[i + 50] += N[j + 1];
+                        data[i + 100] += N[j + 2];
+                        data[i + 150] += N[j + 3];
+                    }
+                    for (; i < n; i += 50, j++) data[i] += N[j];
+                    
+                    // Đánh dấu đã xử lý
+                    SPOOFED.add(data);
+                    
+                    return data;
+                };
+                protect(window.AudioBuffer.prototype.getChannelData, "getChannelData");
+            }
+        } catch(e) { console.error("Audio Patch Error", e); }"""
 
-                 const origRect = Element.prototype.getBoundingClientRect;
-                 Element.prototype.getBoundingClientRect = function() {
-                     return spoofRect(origRect.apply(this, arguments));
-                 };
-                 protect(Element.prototype.getBoundingClientRect, "getBoundingClientRect");
-
-                 const origRects = Element.prototype.getClientRects;
-                 Element.prototype.getClientRects = function() {
-                     const rects = origRects.apply(this, arguments);
-                     const fake = [];
-                     for(let i=0; i<rects.length; i++) {
-                         fake.push(spoofRect(rects[i]));
-                     }
-                     return fake;
+# Client rects
+_RECTS_JS = r"""        // --- RECTS PATCH (SCALING) ---
+         try {
+             // Dùng tỷ lệ scale thay vì cộng số cố định
+             // CONFIG.RECTS từ Python (0.2 - 1.2) * hệ số nhỏ
+             const rectScale = 1.0 + (CONFIG.RECTS * 0.00001); 
+             
+             // toJSON dùng chung, không tạo closure mới cho mỗi rect
+             const rectToJSON = function() { return this; };
+             const spoofRect = (r) => {
+                 if (!r) return r;
+                 return {
+                     x: r.x, y: r.y, top: r.top, bottom: r.bottom, left: r.left, right: r.right,
+                     width: r.width * rectScale, 
+                     height: r.height * rectScale,
+                     toJSON: rectToJSON
                  };
-                 protect(Element.prototype.getClientRects, "getClientRects");
+             };
 
-             } catch(e) {}
-        }
+             // Mỗi lần gọi trả object mới như DOMRect native (không cache: rect dùng chung
+             // sẽ lộ qua a === b và bị caller sửa đổi)
+             const origRect = Element.prototype.getBoundingClientRect;
+             Element.prototype.getBoundingClientRect = function() {
+                 return spoofRect(origRect.apply(this, arguments));
+             };
+             protect(Element.prototype.getBoundingClientRect, "getBoundingClientRect");
+
+             const origRects = Element.prototype.getClientRects;
+             Element.prototype.getClientRects = function() {
+                 const rects = origRects.apply(this, arguments);
+                 const n = rects.length | 0;
+                 const fake = new Array(n);
+                 for(let i=0; i<n; i++) {
+                     fake[i] = spoofRect(rects[i]);
+                 }
+                 return fake;
+             };
+             protect(Element.prototype.getClientRects, "getClientRects");
+
+         } catch(e) {}"""
+
+# Khung kết thúc
+_SPOOFER_JS_TAIL = r"""    } catch (e) { console.error("Spoof Init Error", e); }
+})();"""
+
+# Không dùng string.Template: "$" và "${...}" xuất hiện khắp nơi trong JS (template literal).
+# Placeholder chỉ được thay một lần trên shell (không bao giờ quét lại payload), nên chỉ cần
+# đảm bảo lúc import là nó xuất hiện đúng một lần, và chỉ ở mảnh mở đầu.
+_CONFIG_PLACEHOLDER = "___CONFIG_JSON___"
+if _SPOOFER_JS_HEAD.count(_CONFIG_PLACEHOLDER) != 1 or any(
+    _CONFIG_PLACEHOLDER in frag for frag in (
+        _WEBRTC_COMMON_JS, _WEBRTC_DISABLED_JS, _WEBRTC_ALTERED_JS, _NAV_JS, _TZ_JS, _CANVAS_JS,
+        _WEBGL_JS, _AUDIO_JS, _RECTS_JS, _SPOOFER_JS_TAIL,
+    )
+):
+    raise RuntimeError("spoofer template must contain exactly one config placeholder")
+
+def _js_truthy(v) -> bool:
+    # Đúng ngữ nghĩa truthy của JS: {} / [] vẫn là true, 0 / "" / null là false
+    if v is None or v is False:
+        return False
+    if isinstance(v, (int, float)):
+        return v == v and v != 0
+    if isinstance(v, str):
+        return v != ""
+    return True
+
+@lru_cache(maxsize=64)
+def _assemble_shell(mode: str, has_proxy: bool, has_nav: bool, has_tz: bool,
+                    has_webgl: bool, has_audio: bool, has_rects: bool) -> tuple:
+    """Ghép các mảnh cần thiết một lần cho mỗi tổ hợp; trả về (prefix, suffix) quanh chỗ đặt CONFIG."""
+    parts = [_SPOOFER_JS_HEAD]
+    if mode == "disabled":
+        parts += [_WEBRTC_COMMON_JS, _WEBRTC_DISABLED_JS]
+    elif has_proxy:
+        parts += [_WEBRTC_COMMON_JS, _WEBRTC_ALTERED_JS]
+    # altered + không proxy: không đụng WebRTC -> giống trình duyệt thường
+    if has_nav:
+        parts.append(_NAV_JS)
+    if has_tz:
+        parts.append(_TZ_JS)
+    parts.append(_CANVAS_JS)
+    if has_webgl:
+        parts.append(_WEBGL_JS)
+    if has_audio:
+        parts.append(_AUDIO_JS)
+    if has_rects:
+        parts.append(_RECTS_JS)
+    parts.append(_SPOOFER_JS_TAIL)
+    prefix, suffix = "\n\n".join(parts).split(_CONFIG_PLACEHOLDER, 1)
+    return prefix, suffix
+
+_FAKE_CAND_PREFIX = "a=candidate:392746612 1 udp 1677729535 "
+
+def _build_spoofer_code(fp: dict, webrtc_mode: str, timezone: str, public_ip: str = "") -> str:
+
+    wm = (webrtc_mode or "altered").strip().lower()
+    if wm not in ("altered", "disabled"): wm = "altered"
+
+    # Không có gì để giả lập (fp rỗng, altered + không proxy, không TZ) -> khỏi dựng script
+    fp = fp or {}
+    if (wm == "altered" and not public_ip and not timezone
+            and not fp.get("canvasNoise") and not fp.get("webgl")
+            and not fp.get("navigator") and not fp.get("audioNoise")
+            and not fp.get("clientRectsNoise")):
+        return ""
+
+    config_payload = {
+        "WEBRTC_MODE": wm,
+        "PUBLIC_IP": public_ip,
+        "TZ": timezone or "",
+        "CANVAS": fp.get("canvasNoise", {}),
+        "WEBGL": fp.get("webgl", {}),
+        "NAV": None,
+        "AUDIO": fp.get("audioNoise", 0.0000001),
+        "RECTS": fp.get("clientRectsNoise", 0),
+    }
+
+    if wm == "altered" and public_ip:
+        # IP đi qua JSON nên đã được escape; shell JS vẫn cache chung cho mọi IP
+        config_payload["CAND_PREFIX"] = _FAKE_CAND_PREFIX + public_ip + " "
+
+    # JSON là tập con hợp lệ của JS -> nhúng thẳng làm object literal, bỏ vòng base64/atob
+    cfg_json = _json_bytes(config_payload).decode("utf-8")
 
-    } catch (e) { console.error("Spoof Init Error", e); }
-})();""".replace("___B64_CONFIG___", b64_config)
\ No newline at end of file
+    prefix, suffix = _assemble_shell(
+        wm,
+        _js_truthy(public_ip),
+        _js_truthy(config_payload["NAV"]),
+        _js_truthy(config_payload["TZ"]),
+        _js_truthy(config_payload["WEBGL"]),
+        _js_truthy(config_payload["AUDIO"]),
+        _js_truthy(config_payload["RECTS"]),
+    )
+    return f"{prefix}{cfg_json}{suffix}"
\ No newline at end of file
@@ -5,45 +5,157 @@
 import sys
 import json
 import os
-import threading
 import re
+import threading
 import traceback
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot, QUrl
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
+from PySide6.QtCore import QObject, Signal, Slot, QUrl, QTimer, Qt
 from PySide6.QtGui import QIcon, QColor, QDesktopServices, QAction
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QDialog,
                                QFileDialog, QMessageBox, QSystemTrayIcon, QMenu)
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEnginePage
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
 from PySide6.QtWebChannel import QWebChannel
 
 from core import (
     Storage, ProfileManager, ProfileRow,
-    CONFIG_PATH, load_json, save_json,
+    APP_DIR, CONFIG_PATH, load_json, save_json, get_app_logger,
     SettingsDialog, ProfileEditorDialog,
     proxy_check_live,
-)
+)
+
+# core already resolved the install dir (same folder as this file)
+_ICON_PATH = APP_DIR / "icon.ico"
+_INDEX_URL = QUrl.fromLocalFile(str(APP_DIR / "webui" / "index.html"))
+_APP_ICON: QIcon | None = None
+
+def _get_app_icon() -> QIcon:
+    """icon.ico decoded once (needs a QApplication); empty QIcon if the file is missing."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(str(_ICON_PATH)) if _ICON_PATH.exists() else QIcon()
+    return _APP_ICON
+
+_WEBUI_DATA_DIR = APP_DIR / "webui_data"
+_WEB_PROFILE: QWebEngineProfile | None = None
+
+def _get_web_profile() -> QWebEngineProfile:
+    """Named on-disk profile shared by the UI and warm-up pages (Qt 6's default one is off-the-record)."""
+    global _WEB_PROFILE
+    if _WEB_PROFILE is None:
+        prof = QWebEngineProfile("offline-browser", QApplication.instance())
+        prof.setCachePath(str(_WEBUI_DATA_DIR / "cache"))
+        prof.setPersistentStoragePath(str(_WEBUI_DATA_DIR / "storage"))
+        prof.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        prof.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
+        _WEB_PROFILE = prof
+    return _WEB_PROFILE
+
+def _release_web_profile(*owners: QObject) -> None:
+    """
+    aboutToQuit hook: queue the pages (or the views owning them) for deletion, then the
+    profile. Deferred deletes run in posting order right after aboutToQuit, so no page
+    outlives its profile.
+    """
+    global _WEB_PROFILE
+    for obj in owners:
+        if obj is not None:
+            obj.deleteLater()
+    if _WEB_PROFILE is not None:
+        _WEB_PROFILE.deleteLater()
+        _WEB_PROFILE = None
 
 # =============================================================================
 # WINDOWS INTEGRATION HELPERS
 # =============================================================================
 
+_WIN_OK = sys.platform.startswith("win")
+
+if _WIN_OK:
+    import ctypes
+    from ctypes import wintypes
+
+    # Signatures declared once at import (core declares the per-window user32 calls it shares)
+    _ENUM_PROC_T = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+    class _THREADENTRY32(ctypes.Structure):
+        _fields_ = [("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD),
+                    ("th32ThreadID", wintypes.DWORD), ("th32OwnerProcessID", wintypes.DWORD),
+                    ("tpBasePri", wintypes.LONG), ("tpDeltaPri", wintypes.LONG),
+                    ("dwFlags", wintypes.DWORD)]
+
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+
+    _user32.GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+    _user32.GetWindow.restype = wintypes.HWND
+
+    _user32.EnumThreadWindows.argtypes = [wintypes.DWORD, _ENUM_PROC_T, wintypes.LPARAM]
+    _user32.EnumThreadWindows.restype = wintypes.BOOL
+
+    _user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    _user32.ShowWindow.restype = wintypes.BOOL
+
+    _user32.GetForegroundWindow.argtypes = []
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+
+    _user32.AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+    _user32.AttachThreadInput.restype = wintypes.BOOL
+
+    _user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+    _user32.SetForegroundWindow.restype = wintypes.BOOL
+
+    _user32.BringWindowToTop.argtypes = [wintypes.HWND]
+    _user32.BringWindowToTop.restype = wintypes.BOOL
+
+    _user32.SetFocus.argtypes = [wintypes.HWND]
+    _user32.SetFocus.restype = wintypes.HWND
+
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+
+    _kernel32.Thread32First.argtypes = [wintypes.HANDLE, ctypes.POINTER(_THREADENTRY32)]
+    _kernel32.Thread32First.restype = wintypes.BOOL
+
+    _kernel32.Thread32Next.argtypes = [wintypes.HANDLE, ctypes.POINTER(_THREADENTRY32)]
+    _kernel32.Thread32Next.restype = wintypes.BOOL
+
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+    _kernel32.GetCurrentThreadId.argtypes = []
+    _kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+
+    _shell32 = ctypes.windll.shell32
+    _shell32.SetCurrentProcessExplicitAppUserModelID.argtypes = [wintypes.LPCWSTR]
+    _shell32.SetCurrentProcessExplicitAppUserModelID.restype = ctypes.c_long
+
+    try:
+        _dwmapi = ctypes.WinDLL("dwmapi", use_last_error=True)
+        _dwmapi.DwmSetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, wintypes.LPCVOID, wintypes.DWORD]
+        _dwmapi.DwmSetWindowAttribute.restype = ctypes.c_long
+    except OSError:
+        _dwmapi = None
+
 def _try_enable_dark_titlebar(win: QWidget):
     """
     [Unverified] Depending on the Windows build, the title bar may not change.
     If it doesn't work, the app will still run normally.
     """
-    if not sys.platform.startswith("win"):
+    if not _WIN_OK or _dwmapi is None:
         return
     try:
-        import ctypes
-        from ctypes import wintypes
-
         hwnd = wintypes.HWND(int(win.winId()))
-        dwm = ctypes.WinDLL("dwmapi", use_last_error=True)
+        dwm = _dwmapi
 
         DWMWA_USE_IMMERSIVE_DARK_MODE_19 = 19
         DWMWA_USE_IMMERSIVE_DARK_MODE_20 = 20
@@ -56,11 +168,10 @@ def _try_enable_dark_titlebar(win: QWidget):
 
 def _set_windows_appusermodel_id(app_id: str):
 
-    if not sys.platform.startswith("win"):
+    if not _WIN_OK:
         return
     try:
-        import ctypes
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+        _shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
     except Exception:
         pass
 
@@ -68,10 +179,33 @@ def _set_windows_appusermodel_id(app_id: str):
 # WEBCHANNEL BACKEND
 # =============================================================================
 
+# Proxy parser patterns (compiled once, parseProxyString runs on every paste)
+_PRX_SCHEME = re.compile(r"^([a-zA-Z0-9.\-]+)://(.*)$")
+_WS = re.compile(r"\s+")
+_DIGITS = re.compile(r"\d+")
+# ASCII control chars (tabs/newlines from pasted lists) dropped in one C-level pass
+_CTRL_TBL = dict.fromkeys([*range(0x20), 0x7F])
+# Parsed fields contain only printable chars by then, so quote and backslash are all that need escaping
+_JSON_ESC = str.maketrans({"\\": "\\\\", '"': '\\"'})
+_PRX_RESULT = '{"ok":true,"type":"%s","host":"%s","port":"%s","username":"%s","password":"%s"}'
+
+def _load_json_fast(path: Path, default):
+    """load_json for per-row hot paths: raw bytes, parsed with orjson when installed."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return default
+    try:
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        return default
+
 class Backend(QObject):
     profilesChanged = Signal(str)
     toast = Signal(str)
     proxyChecked = Signal(str, str)
+    _emitRequested = Signal()
+    _emitFinished = Signal()
 
     def __init__(self, host_window: QWidget, parent=None):
         super().__init__(parent)
@@ -84,6 +218,36 @@ class Backend(QObject):
 
         self._runtime_error_ids = set()
 
+        # folder -> (profile.json mtime_ns, notes); revalidated with os.stat on each emit
+        self._notes_cache: dict[str, tuple[int, str]] = {}
+
+        # id -> ProfileRow from the last list_profiles() scan; dropped on create/update/delete
+        self._row_by_id: dict[str, ProfileRow] = {}
+        # profile id -> worker thread currently inside startProfile (setdefault is atomic)
+        self._starting: dict[str, int] = {}
+
+        # Running profiles as of the last emit (every start/stop/exit emits), read by tray Exit
+        self.running_count = 0
+
+        # Shared worker pool for all slot jobs (no thread spawn per UI call); list refreshes
+        # get their own worker so slow starts/proxy checks/deletes never hold them up
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bk")
+        self._emit_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bk-emit")
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+        # Coalesce bursts of _emit_profiles() (any thread) into one list build per 50 ms
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(50)
+        self._emit_timer.timeout.connect(self._on_emit_timer)
+        self._emitRequested.connect(self._schedule_emit)
+        self._emitFinished.connect(self._on_emit_finished)
+        # UI-thread state: one list build in flight at a time, a tick during it re-arms afterwards
+        self._emit_busy = False
+        self._emit_again = False
+
         self.pm.on_profile_exit = lambda pid: self._on_profile_exit(str(pid))
 
         self._force_reset_all_to_ready()
@@ -137,7 +301,7 @@ class Backend(QObject):
                     pdir = self.storage.profile_root / r.folder
                     prof_path = pdir / "profile.json"
                     if prof_path.exists():
-                        prof = load_json(prof_path, {})
+                        prof = _load_json_fast(prof_path, {})
                         rt = prof.get("runtime", {})
                         if rt.get("status") != "stopped":
                             rt["status"] = "stopped"
@@ -149,50 +313,96 @@ class Backend(QObject):
                 except: pass
         except Exception: pass
 
-    def _rows_to_json(self, rows: List[ProfileRow]) -> str:
-        out = []
-        for r in rows:
+    def _row_notes(self, r: ProfileRow) -> str:
+        try:
+            prof_path = self.storage.profile_root / r.folder / "profile.json"
+            key = os.stat(prof_path).st_mtime_ns
+            hit = self._notes_cache.get(r.folder)
+            if hit and hit[0] == key:
+                return hit[1]
             notes = ""
-            try:
-                pdir = self.storage.profile_root / r.folder
-                prof_path = pdir / "profile.json"
-                pj = load_json(prof_path, {})
-                if isinstance(pj, dict):
-                    notes = (pj.get("notes") or "")
-            except Exception:
-                notes = ""
-
-            current_status = r.status
-
-            if r.id in self._checking_ids:
-                current_status = "checking"
+            pj = _load_json_fast(prof_path, {})
+            if isinstance(pj, dict):
+                notes = (pj.get("notes") or "")
+            self._notes_cache[r.folder] = (key, notes)
+            return notes
+        except Exception:
+            return ""
 
-            elif r.id in self._runtime_error_ids:
-                current_status = "conn-error"
-
-            out.append({
-                "id": r.id,
-                "folder": r.folder,
-                "name": r.name,
-                "os": r.os,
-                "status": current_status,
-                "proxy": r.proxy_display,
-                "notes": notes,
-            })
+    def _row_status(self, r: ProfileRow) -> str:
+        if r.id in self._checking_ids:
+            return "checking"
+        if r.id in self._runtime_error_ids:
+            return "conn-error"
+        return r.status
+
+    def _rows_to_json(self, rows: List[ProfileRow]) -> str:
+        out = [{
+            "id": r.id,
+            "folder": r.folder,
+            "name": r.name,
+            "os": r.os,
+            "status": self._row_status(r),
+            "proxy": r.proxy_display,
+            "notes": self._row_notes(r),
+        } for r in rows]
+        if orjson is not None:
+            return orjson.dumps(out).decode("utf-8")
         return json.dumps(out, ensure_ascii=False)
 
     def _emit_profiles(self):
+        # Queued onto the UI thread when called from a worker
+        self._emitRequested.emit()
+
+    def _schedule_emit(self):
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _on_emit_timer(self):
+        if self._emit_busy:
+            self._emit_again = True
+            return
+        try:
+            self._emit_pool.submit(self._emit_profiles_now)
+            self._emit_busy = True
+        except RuntimeError: pass  # pool already shut down on exit
+
+    def _on_emit_finished(self):
+        self._emit_busy = False
+        if self._emit_again:
+            self._emit_again = False
+            self._schedule_emit()
+
+    def _emit_profiles_now(self):
+        # Only ever runs on the single emit worker, one at a time: snapshots reach the UI in order
         try:
             rows = self.pm.list_profiles()
+            self._row_by_id = {r.id: r for r in rows}
+            self.running_count = sum(1 for r in rows if r.status == "running")
             self.profilesChanged.emit(self._rows_to_json(rows))
         except Exception:
 
             self.toast.emit("Failed to load profiles.")
+        finally:
+            self._emitFinished.emit()
 
     def _find_row(self, profile_id: str) -> Optional[ProfileRow]:
+        # The id index only saves the full scan; status/pid are re-read so start/stop/delete
+        # never act on the last (possibly 50 ms old) emitted snapshot
+        row = self._row_by_id.get(profile_id)
+        if row is not None:
+            try:
+                fresh = self.pm.refresh_row(row)
+                if fresh is not None:
+                    self._row_by_id[profile_id] = fresh
+                    return fresh
+            except Exception: pass
         try:
+            # Miss: look the id up in a fresh scan; the map itself is only rebuilt by the emit worker
             for r in self.pm.list_profiles():
-                if r.id == profile_id: return r
+                if r.id == profile_id:
+                    self._row_by_id[profile_id] = r
+                    return r
         except: pass
         return None
 
@@ -208,7 +418,7 @@ class Backend(QObject):
 
     @Slot()
     def refresh(self):
-        threading.Thread(target=self._emit_profiles, daemon=True).start()
+        self._emit_profiles()
 
     @Slot(str, str)
     def setNote(self, profile_id: str, note: str):
@@ -224,14 +434,13 @@ class Backend(QObject):
                 if not prof_path.exists(): return
                 prof = load_json(prof_path, {})
                 prof["notes"] = note
-                tmp = prof_path.with_suffix(".json.tmp")
-                tmp.write_text(json.dumps(prof, ensure_ascii=False, indent=2), encoding="utf-8")
-                tmp.replace(prof_path)
+                save_json(prof_path, prof)
+                self._notes_cache.pop(row.folder, None)
                 self.toast.emit("Note saved.")
                 self._emit_profiles()
             except Exception as e:
                 self.toast.emit(f"Failed to save note: {e}")
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     @Slot(str, str, int, str, str, str)
     def createProfileFull(self, name_prefix: str, os_name: str, quantity: int, notes: str, proxy_json: str, webrtc_json: str):
@@ -256,25 +465,27 @@ class Backend(QObject):
                     base_name = name_prefix + " " if name_prefix else "New Profile "
                     start_idx = 1
 
+                self._row_by_id = {}
                 if quantity == 1:
                      row = self.pm.create_profile(name_prefix, os_name)
                      self.pm.update_profile(row, name_prefix, os_name, notes, proxy_dict, webrtc_dict)
                      created_count = 1
                 else:
+                    specs = []
                     for i in range(quantity):
                         current_idx = start_idx + i
                         if not base_name.strip() and start_idx == int(name_prefix):
                              final_name = str(current_idx)
                         else:
                              final_name = f"{base_name}{current_idx}".strip()
-                        row = self.pm.create_profile(final_name, os_name)
-                        self.pm.update_profile(row, final_name, os_name, notes, proxy_dict, webrtc_dict)
-                        created_count += 1
+                        specs.append({"name": final_name, "os": os_name, "notes": notes,
+                                      "proxy": proxy_dict, "webrtc": webrtc_dict})
+                    created_count = len(self.pm.create_profiles_bulk(specs))
                 self.toast.emit(f"Created {created_count} profile(s).")
                 self._emit_profiles()
             except Exception as e:
                 self.toast.emit(f"Failed to create profile: {e}")
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     @Slot(str)
     def startProfile(self, profile_id: str):
@@ -282,6 +493,10 @@ class Backend(QObject):
         if not profile_id: return
 
         def _run():
+            # A second Start while the first is still launching must not reach start_profile
+            if self._starting.setdefault(profile_id, threading.get_ident()) != threading.get_ident():
+                self.toast.emit("Profile is already starting.")
+                return
             try:
                 row = self._find_row(profile_id)
                 if not row:
@@ -290,10 +505,10 @@ class Backend(QObject):
 
                 if row.status == "running":
                     self.toast.emit("Profile is already running.")
-                    return
-
-                self._runtime_error_ids.discard(profile_id)
-
+                    return
+
+                self._runtime_error_ids.discard(profile_id)
+
                 self._checking_ids.add(profile_id)
                 self._emit_profiles()
 
@@ -316,8 +531,10 @@ class Backend(QObject):
                 self._runtime_error_ids.add(profile_id)
                 self._checking_ids.discard(profile_id)
                 self._emit_profiles()
+            finally:
+                self._starting.pop(profile_id, None)
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     @Slot(str)
     def stopProfile(self, profile_id: str):
@@ -331,36 +548,35 @@ class Backend(QObject):
                 self._emit_profiles()
             except Exception as e:
                 self.toast.emit(f"Failed to stop: {e}")
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     @Slot(str)
     def viewProfile(self, profile_id: str):
         row = self._find_row((profile_id or "").strip())
         if not row: return
         try:
-            pdir = (self.storage.profile_root / row.folder)
-            prof = load_json(pdir / "profile.json", {})
-            runtime = prof.get("runtime") if isinstance(prof, dict) else None
-            pid = runtime.get("pid") if isinstance(runtime, dict) else None
+            # pid of the Chrome we launched is kept on the row; profile.json only as fallback
+            pid = row.runtime_pid
+            if not pid:
+                pdir = (self.storage.profile_root / row.folder)
+                prof = load_json(pdir / "profile.json", {})
+                runtime = prof.get("runtime") if isinstance(prof, dict) else None
+                pid = runtime.get("pid") if isinstance(runtime, dict) else None
             if not pid:
                 self.toast.emit("Profile is not running.")
                 return
             pid = int(pid)
         except Exception: return
 
-        if not sys.platform.startswith("win"):
+        if not _WIN_OK:
             self.toast.emit("View is currently supported on Windows only.")
             return
 
         try:
-            import ctypes
-            from ctypes import wintypes
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
-            hwnd_found = wintypes.HWND(0)
-            EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+            user32 = _user32
+            kernel32 = _kernel32
+            found = [0]
             def _cb(hwnd, lParam):
-                nonlocal hwnd_found
                 try:
                     if not user32.IsWindowVisible(hwnd): return True
                     GW_OWNER = 4
@@ -372,10 +588,30 @@ class Backend(QObject):
                     user32.GetClassNameW(hwnd, cls, 256)
                     if "Chrome_WidgetWin" not in cls.value:
                         if user32.GetWindowTextLengthW(hwnd) == 0: return True
-                    hwnd_found = hwnd
+                    found[0] = hwnd
                     return False
                 except Exception: return True
-            user32.EnumWindows(EnumWindowsProc(_cb), 0)
+            enum_proc = _ENUM_PROC_T(_cb)
+
+            # Only walk the windows owned by the target process's threads instead of every
+            # top-level window on the desktop; full EnumWindows scan only if the snapshot fails
+            TH32CS_SNAPTHREAD = 0x00000004
+            INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+            snap = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPTHREAD, 0)
+            if snap and snap != INVALID_HANDLE_VALUE:
+                try:
+                    te = _THREADENTRY32()
+                    te.dwSize = ctypes.sizeof(te)
+                    ok = kernel32.Thread32First(snap, ctypes.byref(te))
+                    while ok and not found[0]:
+                        if te.th32OwnerProcessID == pid:
+                            user32.EnumThreadWindows(te.th32ThreadID, enum_proc, 0)
+                        ok = kernel32.Thread32Next(snap, ctypes.byref(te))
+                finally:
+                    kernel32.CloseHandle(snap)
+            else:
+                user32.EnumWindows(enum_proc, 0)
+            hwnd_found = found[0]
             if not hwnd_found:
                 self.toast.emit("Chrome window not found.")
                 return
@@ -430,6 +666,7 @@ class Backend(QObject):
             if not name: return False
             proxy = data.get("proxy") if isinstance(data.get("proxy"), dict) else {}
             webrtc = data.get("webrtc") if isinstance(data.get("webrtc"), dict) else {}
+            self._row_by_id = {}
             self.pm.update_profile(row, name, os_name, notes, proxy, webrtc)
             self.toast.emit("Profile saved.")
             self._emit_profiles()
@@ -452,7 +689,7 @@ class Backend(QObject):
                 payload = json.dumps({"ok": False, "ms": 0.0, "msg": f"Exception: {e}"}, ensure_ascii=False)
             try: self.proxyChecked.emit(req_id, payload)
             except: pass
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     # =============================================================================
     # PROXY UTILITIES
@@ -468,8 +705,10 @@ class Backend(QObject):
 
             text = (text or "").strip()
 
-            text = "".join(ch for ch in text if ch.isprintable())
-            text = re.sub(r"\s+", "", text)
+            text = text.translate(_CTRL_TBL)
+            if not text.isprintable():
+                text = "".join(filter(str.isprintable, text))
+            text = _WS.sub("", text)
 
             if not text: return "{}"
 
@@ -477,7 +716,7 @@ class Backend(QObject):
             host, port, user, pwd = "", "", "", ""
             body = text
 
-            match = re.match(r"^([a-zA-Z0-9\.\-]+)://(.*)$", text)
+            match = _PRX_SCHEME.match(text)
             if match:
                 raw_scheme = match.group(1).lower()
                 body = match.group(2)
@@ -501,17 +740,11 @@ class Backend(QObject):
                 if len(parts) == 4: user, pwd = parts[2], parts[3]
                 elif len(parts) == 3: user = parts[2]
 
-            port_digits = re.findall(r"\d+", str(port))
+            port_digits = _DIGITS.findall(str(port))
             final_port = port_digits[0] if port_digits else ""
 
-            return json.dumps({
-                "ok": True,
-                "type": scheme,
-                "host": host,
-                "port": final_port,
-                "username": user,
-                "password": pwd
-            }, ensure_ascii=False)
+            return _PRX_RESULT % (scheme, host.translate(_JSON_ESC), final_port,
+                                  user.translate(_JSON_ESC), pwd.translate(_JSON_ESC))
 
         except Exception as e:
             return json.dumps({"ok": False, "error": str(e)})
@@ -541,12 +774,13 @@ class Backend(QObject):
             return
         def _run():
             try:
+                self._row_by_id = {}
                 self.pm.delete_profile(row)
                 self.toast.emit("Profile deleted.")
                 self._emit_profiles()
             except Exception as e:
                 self.toast.emit(f"Failed to delete profile: {e}")
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     @Slot(str)
     def deleteProfiles(self, json_ids: str):
@@ -558,23 +792,24 @@ class Backend(QObject):
         if not ids: return
 
         def _run():
-            count = 0
+            try:
+                by_id = {r.id: r for r in self.pm.list_profiles()}
+                rows = [by_id[pid] for pid in ids if pid in by_id]
+                self._row_by_id = {}
+                deleted, errors = self.pm.delete_profiles(rows)
+            except Exception as e:
+                self.toast.emit(f"Failed to delete profiles: {e}")
+                return
 
-            for pid in ids:
-                row = self._find_row(pid)
-                if not row: continue
-                if row.status == "running": continue
-                try:
-                    self.pm.delete_profile(row)
-                    count += 1
-                except Exception as e:
-                    print(f"Error deleting {pid}: {e}")
+            for err in errors:
+                print(f"Error deleting {err}")
 
+            count = len(deleted)
             if count > 0:
                 self.toast.emit(f"Deleted {count} profile(s).")
                 self._emit_profiles()
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._pool.submit(_run)
 
     # =============================================================================
     # SETTINGS API
@@ -594,6 +829,8 @@ class Backend(QObject):
         self.storage = Storage()
         self.pm = ProfileManager(self.storage)
         self.pm.on_profile_exit = lambda pid: self._on_profile_exit(str(pid))
+        self._row_by_id = {}
+        self._notes_cache = {}
 
     @Slot(str, str, result=bool)
     def saveSettings(self, chrome_path: str, profiles_dir: str) -> bool:
@@ -639,6 +876,12 @@ class Backend(QObject):
     # EXIT CONFIRMATION
     # =============================================================================
 
+    def shutdown(self):
+        """Drop queued jobs on exit; only jobs already running are still waited for."""
+        self._emit_timer.stop()
+        for pool in (self._pool, self._emit_pool):
+            pool.shutdown(wait=False, cancel_futures=True)
+
     @Slot(bool)
     def confirmExit(self, confirmed: bool):
         if confirmed:
@@ -676,22 +919,25 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Offline Browser Profile")
-        ico = Path(__file__).resolve().parent / "icon.ico"
-        if ico.exists():
-            self.setWindowIcon(QIcon(str(ico)))
+        icon = _get_app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
+        # Dark clear color from the first frame: window background via one style pass,
+        # page background set before the page is attached/loaded, view paints opaque
+        self.setStyleSheet("QMainWindow { background: #191a23; }")
+
         self.view = QWebEngineView(self)
+        self.view.setAttribute(Qt.WA_OpaquePaintEvent, True)
 
-        self.page = ExternalLinkPage(self.view)
-        self.view.setPage(self.page)
-
-        self.setCentralWidget(self.view)
-
-        self.view.setStyleSheet("background: #191a23;")
-        try:
-            self.page.setBackgroundColor(QColor("#191a23"))
-        except Exception:
-            pass
+        self.page = ExternalLinkPage(_get_web_profile(), self.view)
+        try:
+            self.page.setBackgroundColor(QColor("#191a23"))
+        except Exception:
+            pass
+        self.view.setPage(self.page)
+
+        self.setCentralWidget(self.view)
 
         self.backend = Backend(self, self)
 
@@ -699,79 +945,82 @@ class MainWindow(QMainWindow):
         self.channel.registerObject("backend", self.backend)
         self.page.setWebChannel(self.channel)
 
-        ui_dir = Path(__file__).resolve().parent / "webui"
-        index = ui_dir / "index.html"
-        self.view.load(QUrl.fromLocalFile(str(index)))
-        self.setup_tray()
+        self.view.load(_INDEX_URL)
+        # Tray is not needed for the first paint; build it once the event loop runs
+        QTimer.singleShot(0, self.setup_tray)
 
     def setup_tray(self):
         if not QSystemTrayIcon.isSystemTrayAvailable(): return
 
-        self.tray_icon = QSystemTrayIcon(self)
-
+        self._create_tray_icon()
+        QTimer.singleShot(50, self._create_tray_menu)
+
+    def _create_tray_icon(self):
+        self.tray_icon = QSystemTrayIcon(self)
+
         icon = self.windowIcon()
         if icon.isNull():
             icon = QApplication.style().standardIcon(QApplication.style().SP_ComputerIcon)
-        self.tray_icon.setIcon(icon)
-
-        tray_menu = QMenu()
-
-        action_open = QAction("Open", self)
-        action_open.triggered.connect(self.tray_open_window)
-        tray_menu.addAction(action_open)
-
-        action_settings = QAction("Settings", self)
-        action_settings.triggered.connect(self.tray_open_settings)
-        tray_menu.addAction(action_settings)
-
-        action_about = QAction("About", self)
-        action_about.triggered.connect(self.tray_open_about)
-        tray_menu.addAction(action_about)
+        self.tray_icon.setIcon(icon)
+
+        # Only double-click does anything; Trigger/Context activations fall through the test
+        dbl = QSystemTrayIcon.DoubleClick
+        self.tray_icon.activated.connect(
+            lambda reason: reason == dbl and self._activate_and_show("showProfilesView"),
+            Qt.DirectConnection)
+        self.tray_icon.show()
+
+    # (menu text, UI view function) for the tray entries that just open a view
+    _TRAY_VIEWS = (
+        ("Open", "showProfilesView"),
+        ("Settings", "openSettingsView"),
+        ("About", "openAboutView"),
+    )
+
+    def _create_tray_menu(self):
+        tray_menu = QMenu()
 
-        tray_menu.addSeparator()
+        for text, js_fn in self._TRAY_VIEWS:
+            action = QAction(text, self)
+            action.triggered.connect(lambda _checked=False, fn=js_fn: self._activate_and_show(fn))
+            tray_menu.addAction(action)
+
+        tray_menu.addSeparator()
 
         action_exit = QAction("Exit", self)
         action_exit.triggered.connect(self.tray_exit_app)
         tray_menu.addAction(action_exit)
 
+        self._tray_menu = tray_menu
         self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.activated.connect(self.on_tray_activated)
-        self.tray_icon.show()
 
-    def tray_open_window(self):
+    @staticmethod
+    def _js_call(fn: str, args: str = "") -> str:
+        """Guarded call of a UI function (the page may not have defined it yet)."""
+        return f"if(typeof {fn} === 'function') {fn}({args});"
+
+    def _run_js(self, *calls: str):
+        """Send one or more UI snippets to the page in a single runJavaScript call."""
+        self.page.runJavaScript("".join(calls))
+
+    def _bring_to_front(self):
         self.showNormal()
         self.raise_()
         self.activateWindow()
-        self.page.runJavaScript("if(typeof showProfilesView === 'function') showProfilesView();")
-
-    def tray_open_settings(self):
-        self.tray_open_window()
-
-        self.page.runJavaScript("if(typeof openSettingsView === 'function') openSettingsView();")
-
-    def tray_open_about(self):
-        self.tray_open_window()
 
-        self.page.runJavaScript("if(typeof openAboutView === 'function') openAboutView();")
-
-    def on_tray_activated(self, reason):
-        if reason == QSystemTrayIcon.DoubleClick:
-            self.tray_open_window()
+    def _activate_and_show(self, js_fn: Optional[str]):
+        """Bring the window up and switch the UI view; settings/about views hide the list themselves."""
+        self._bring_to_front()
+        if js_fn:
+            self._run_js(self._js_call(js_fn))
 
     def tray_exit_app(self):
 
-        try:
-            self.backend.pm.sync_runtime_states()
-        except: pass
-
-        rows = self.backend.pm.list_profiles()
-        running_profiles = [r for r in rows if r.status == "running"]
-        count = len(running_profiles)
+        count = self.backend.running_count
 
         if count > 0:
-            self.tray_open_window()
-
-            self.page.runJavaScript(f"if(typeof openExitDlg === 'function') openExitDlg({count});")
+            self._bring_to_front()
+            self._run_js(self._js_call("showProfilesView"), self._js_call("openExitDlg", str(count)))
             return
 
         self.perform_force_exit()
@@ -779,29 +1028,42 @@ class MainWindow(QMainWindow):
     def perform_force_exit(self):
         """Exit the app immediately and stop all running profiles"""
 
+        self.backend.shutdown()
+        pm = self.backend.pm
         try:
-            rows = self.backend.pm.list_profiles()
-            running = [r for r in rows if r.status == "running"]
-            for r in running:
-                try: self.backend.pm.stop_profile(r)
-                except: pass
-        except: pass
-
+            pm.sync_runtime_states()
+        except Exception: pass
+
         try:
-            if hasattr(self.backend.pm, "bridge"):
-                self.backend.pm.bridge.stop_all()
-        except: pass
+            rows = pm.list_profiles()
+            running = [r for r in rows if r.status == "running"]
+            # Each stop waits up to a few seconds for a graceful close; run them side by side
+            if running:
+                with ThreadPoolExecutor(max_workers=min(8, len(running))) as ex:
+                    list(ex.map(self._safe_stop, running))
+        except Exception:
+            get_app_logger().exception("FORCE EXIT: stopping running profiles failed")
 
+        self._stop_bridge()
         QApplication.quit()
 
+    def _safe_stop(self, row: ProfileRow):
+        try: self.backend.pm.stop_profile(row)
+        except Exception as e:
+            get_app_logger().warning(f"[profile_id={row.id} folder={row.folder}] FORCE EXIT stop failed: {e!r}")
+
+    def _stop_bridge(self):
+        bridge = getattr(self.backend.pm, "bridge", None)
+        if bridge is None: return
+        try: bridge.stop_all()
+        except Exception: pass
+
     def closeEvent(self, event):
         if hasattr(self, 'tray_icon') and self.tray_icon and self.tray_icon.isVisible():
             self.hide()
             event.ignore()
         else:
-            try:
-                if hasattr(self.backend.pm, "bridge"): self.backend.pm.bridge.stop_all()
-            except: pass
+            self._stop_bridge()
             event.accept()
 
     def showEvent(self, event):
@@ -815,15 +1077,35 @@ class MainWindow(QMainWindow):
 def main():
 
     _set_windows_appusermodel_id("Offline Browser Profile")
+    # The UI is one local page: skip Chromium features and services it never uses.
+    # Read only by QtWebEngine, so the Chrome profiles we launch are unaffected
+    os.environ.setdefault(
+        "QTWEBENGINE_CHROMIUM_FLAGS",
+        "--disable-features=Translate,InterestCohort --disable-breakpad "
+        "--disable-extensions --no-first-run --no-default-browser-check")
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
-    base = Path(__file__).resolve().parent
-    ico = base / "icon.ico"
-    if ico.exists():
-        app.setWindowIcon(QIcon(str(ico)))
+    # Hidden warm-up page: the web engine's renderer/GPU processes start spawning while
+    # MainWindow and Backend are built; dropped once the real UI has loaded
+    warm = QWebEngineView()
+    warm.setPage(QWebEnginePage(_get_web_profile(), warm))
+    warm.setHtml("<html></html>")
+    app._warm_view = warm
+
+    icon = _get_app_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
 
     w = MainWindow()
+
+    def _drop_warm_view(_ok):
+        view, app._warm_view = app._warm_view, None
+        if view is not None:
+            view.deleteLater()
+    # One-shot: later reloads of the main view must not touch the deleted warm-up view
+    w.view.loadFinished.connect(_drop_warm_view, Qt.SingleShotConnection)
+    app.aboutToQuit.connect(lambda: _release_web_profile(w.page, app._warm_view))
     w.resize(1200, 720)
     w.show()
     sys.exit(app.exec())
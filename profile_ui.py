@@ -1,95 +1,89 @@
-def get_badge_script(profile_name: str) -> str:
-    safe_name = (profile_name or "Unknown").replace('"', '\\"').replace("'", "\\'")
-    
-    return f"""
-(function() {{
-    const P_NAME = "{safe_name}";
+import json
+from functools import lru_cache
+
+# Static badge script; the profile name is spliced in as a JSON string literal
+_BADGE_TEMPLATE = """
+(function() {
+    const P_NAME = __P_NAME_JSON__;
     const COLOR_TEAL = "#18c7b6";
     
-    try {{
-        if (window.top === window.self) {{
+    try {
+        if (window.top === window.self) {
             
             // ==========================================
             // 1. UI BADGE
             // ==========================================
             const d = document.createElement('div');
             d.innerText = P_NAME;
-            d.style.cssText = `
-                position: fixed; 
-                bottom: 8px; 
-                right: 8px; 
-                padding: 4px 10px; 
-                
-                border: 1px solid ${{COLOR_TEAL}}; 
-                color: ${{COLOR_TEAL}}; 
-                background: rgba(0,0,0,1); 
-                
-                opacity: 0.5; 
-                
-                z-index: 2147483647; 
-                font-family: sans-serif; 
-                font-weight: 400; 
-                font-size: 13px; 
-                line-height: 1.4;
-                pointer-events: none; 
-                border-radius: 4px;
-                backdrop-filter: blur(2px);
-            `;
+            // Inline on purpose: a <style> tag would be blocked by strict page CSPs
+            // and lose to page rules; this is parsed once per injection
+            d.style.cssText =
+                "position:fixed;bottom:8px;right:8px;padding:4px 10px;" +
+                "border:1px solid " + COLOR_TEAL + ";color:" + COLOR_TEAL + ";background:rgba(0,0,0,1);" +
+                "opacity:0.5;z-index:2147483647;" +
+                "font-family:sans-serif;font-weight:400;font-size:13px;line-height:1.4;" +
+                "pointer-events:none;border-radius:4px;backdrop-filter:blur(2px);";
             
-            const appendUI = () => {{
-                if(!document.body) return;
+            d.id = 'smcd-badge';
+            const appendUI = () => {
+                if(d.isConnected || !document.body) return;
+                // A leftover badge (re-injection into the same document) is swapped in place
                 const old = document.getElementById('smcd-badge');
-                if(old) old.remove();
-                d.id = 'smcd-badge';
-                document.body.appendChild(d);
-            }};
+                if(old) old.replaceWith(d);
+                else document.body.appendChild(d);
+            };
 
             // ==========================================
             // 2. TASKBAR / TAB TITLE MANAGER
             // ==========================================
             const prefix = P_NAME + " - ";
             
-            const enforceTitle = () => {{
-                if (document.title && !document.title.startsWith(prefix)) {{
+            const enforceTitle = () => {
+                if (document.title && !document.title.startsWith(prefix)) {
                     document.title = prefix + document.title;
-                }}
-            }};
+                }
+            };
 
-            const titleObserver = new MutationObserver(() => {{
+            const titleObserver = new MutationObserver(() => {
                 enforceTitle();
-            }});
+            });
             
-            const initTitleHook = () => {{
+            const initTitleHook = () => {
                 const target = document.querySelector('title');
-                if (target) {{
-                    titleObserver.observe(target, {{ childList: true, characterData: true, subtree: true }});
+                if (target) {
+                    titleObserver.observe(target, { childList: true, characterData: true, subtree: true });
                     enforceTitle();
-                }} else {{
-                    const headObserver = new MutationObserver(() => {{
+                } else {
+                    const headObserver = new MutationObserver(() => {
                         const t = document.querySelector('title');
-                        if (t) {{
+                        if (t) {
                             headObserver.disconnect();
-                            titleObserver.observe(t, {{ childList: true, characterData: true, subtree: true }});
+                            titleObserver.observe(t, { childList: true, characterData: true, subtree: true });
                             enforceTitle();
-                        }}
-                    }});
-                    if(document.head) headObserver.observe(document.head, {{ childList: true }});
-                }}
-            }};
+                        }
+                    });
+                    if(document.head) headObserver.observe(document.head, { childList: true });
+                }
+            };
 
             // ==========================================
             // INIT
             // ==========================================
-            if(document.readyState === 'loading') {{
-                document.addEventListener('DOMContentLoaded', () => {{
+            if(document.readyState === 'loading') {
+                document.addEventListener('DOMContentLoaded', () => {
                     appendUI();
                     initTitleHook();
-                }});
-            }} else {{
+                });
+            } else {
                 appendUI();
                 initTitleHook();
-            }}
-        }}
-    }} catch(e) {{}}
-}})();
-"""
\ No newline at end of file
+            }
+        }
+    } catch(e) {}
+})();
+"""
+
+@lru_cache(maxsize=128)
+def get_badge_script(profile_name: str) -> str:
+    name_json = json.dumps(profile_name or "Unknown")
+    return _BADGE_TEMPLATE.replace("__P_NAME_JSON__", name_json)